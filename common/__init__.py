@@ -1,5 +1,5 @@
 #!/usr/bin/env python3
 
-from .base import BaseSchedulerSetup, BaseSchedulerStatus, BaseSchedulerUninstall
+from .base import NO_WINDOW, BaseSchedulerSetup, BaseSchedulerStatus, BaseSchedulerUninstall, cached_probe, current_platform, lazy_exports, probe_claude, tail_lines, which, write_atomic
 
-__all__ = ['BaseSchedulerSetup', 'BaseSchedulerStatus', 'BaseSchedulerUninstall']
\ No newline at end of file
+__all__ = ['NO_WINDOW', 'BaseSchedulerSetup', 'BaseSchedulerStatus', 'BaseSchedulerUninstall', 'cached_probe', 'current_platform', 'lazy_exports', 'probe_claude', 'tail_lines', 'which', 'write_atomic']
\ No newline at end of file
@@ -2,18 +2,271 @@
 
 import os
 import sys
+import re
 import json
-import platform
-import subprocess
-import shutil
-import stat
+import copy
 from pathlib import Path
-import getpass
-from string import Template
-from datetime import datetime, timedelta
+import functools
+import time
 from abc import ABC, abstractmethod
 
 
+# Resolved once per process - these never change between instantiations
+# sys.platform is a constant; platform.system() would cost an extra module import
+_PLATFORM = {'darwin': 'macos', 'win32': 'windows'}.get(sys.platform, sys.platform)
+_HOME_DIR = Path.home()
+_SCRIPT_DIR = Path(__file__).resolve().parent.parent
+_DEFAULT_CONFIG_PATH = _SCRIPT_DIR / 'config.json'
+
+# For Windows children whose output is captured: no console of their own, so nothing flashes up
+# when the tools run without one (e.g. under pythonw). 0 off Windows, where it doesn't exist.
+# The value of subprocess.CREATE_NO_WINDOW, so importing this module doesn't load subprocess.
+NO_WINDOW = 0x08000000 if _PLATFORM == 'windows' else 0
+
+_PATH_SEPARATOR_RE = re.compile(r'[/\\]')
+
+# An allowed executable: exactly 'claude', or a path that mentions claude in any case
+_CLAUDE_EXE_RE = re.compile(r'claude|(?=.*[/\\])(?i:.*claude.*)')
+
+# Zero-padded "00".."59" for building HH:MM strings without format specs
+_DD = tuple(f"{i:02d}" for i in range(60))
+
+# Simple mode's four daily sessions, in hours after start_time
+_SESSION_HOUR_OFFSETS = (0, 5, 10, 15)
+
+
+def current_platform():
+    """The running platform as 'macos', 'linux' or 'windows' (anything else as sys.platform names it)"""
+    return _PLATFORM
+
+
+def lazy_exports(package, exports):
+    """A module-level __getattr__ for `package` that imports each exported name's submodule on first access.
+    
+    `exports` maps name -> relative submodule (e.g. 'LinuxSchedulerSetup': '.setup'), so
+    importing one submodule of a platform package doesn't also load its siblings.
+    """
+    def __getattr__(name):
+        if name not in exports:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        import importlib
+        return getattr(importlib.import_module(exports[name], package), name)
+    return __getattr__
+
+
+def _resolve_config_path(config_path):
+    """Config paths are relative to the project directory; the default is precomputed"""
+    if config_path == 'config.json':
+        return _DEFAULT_CONFIG_PATH
+    return _SCRIPT_DIR / config_path
+
+
+# subprocess, shutil and getpass are imported inside the functions that need them -
+# most status/uninstall runs never do, and subprocess alone pulls in ~20 modules
+@functools.lru_cache(maxsize=None)
+def _get_username():
+    import getpass
+    return getpass.getuser()
+
+
+@functools.lru_cache(maxsize=16)
+def _compute_schedule_times(start_time_str, wake_minutes):
+    """Compute (time, wake_minutes_before) pairs at 5-hour intervals from start_time"""
+    hour, minute = map(int, start_time_str.split(':'))
+    minute_str = f"{minute:02d}"
+    
+    return tuple((_DD[(hour + offset) % 24] + ':' + minute_str, wake_minutes)
+                 for offset in _SESSION_HOUR_OFFSETS)
+
+
+def _annotate_schedule(schedule):
+    """Parse each entry's 'HH:MM' once into '_hour'/'_minute' ints, plus the
+    '_wake_hour'/'_wake_minute' it wakes at (wrapping around midnight).
+    
+    Underscore keys are runtime-only and are stripped again by save_config.
+    """
+    for sched in schedule:
+        hour, minute = sched['time'].split(':')
+        sched['_hour'] = int(hour)
+        sched['_minute'] = int(minute)
+        wake = (sched['_hour'] * 60 + sched['_minute'] - sched.get('wake_minutes_before', 5)) % (24 * 60)
+        sched['_wake_hour'], sched['_wake_minute'] = divmod(wake, 60)
+    return schedule
+
+
+# Parsed config files keyed by path, invalidated when the file's mtime changes
+_CONFIG_CACHE = {}
+
+
+def _load_config_cached(path, st=None):
+    """Load a JSON config file, reusing the parsed result while it is unchanged.
+    
+    Pass st (an os.stat result) when the caller has already stat'ed the file.
+    """
+    key = str(path)
+    if st is None:
+        st = os.stat(key)
+    # Size as well as mtime: a same-second rewrite on a coarse-mtime filesystem still invalidates
+    version = (st.st_mtime_ns, st.st_size)
+    
+    cached = _CONFIG_CACHE.get(key)
+    if cached is None or cached[0] != version:
+        cached = (version, json.loads(path.read_bytes()))
+        _CONFIG_CACHE[key] = cached
+    
+    # Callers mutate their config (e.g. adding 'schedule'), so hand out a copy
+    return copy.deepcopy(cached[1])
+
+
+# PATH is fixed for the life of the process, so split it once
+_PATH_DIRS = tuple(d or os.curdir for d in os.environ.get('PATH', os.defpath).split(os.pathsep))
+
+
+def which(name):
+    """POSIX-only shutil.which: no PATHEXT or case-folding work, just an access() per PATH entry"""
+    for directory in _PATH_DIRS:
+        candidate = os.path.join(directory, name)
+        if os.access(candidate, os.X_OK) and not os.path.isdir(candidate):
+            return candidate
+    return None
+
+
+_PROBE_CACHE_DIR = _HOME_DIR / '.cache' / 'claude-scheduler'
+
+
+def cached_probe(name, ttl, probe, refresh=False):
+    """Return probe(), reusing a result saved on disk less than `ttl` seconds ago.
+    
+    Only truthy results are saved, so a fresh install is picked up immediately; a falsy
+    one discards any earlier result, so a refresh isn't undone by the next cached read.
+    The result must be JSON-serializable; lists come back as lists.
+    """
+    cache_file = _PROBE_CACHE_DIR / f'{name}.json'
+    
+    if not refresh:
+        try:
+            cached = json.loads(cache_file.read_bytes())
+            if time.time() - cached['ts'] < ttl:
+                return cached['value']
+        except (OSError, ValueError, KeyError):
+            pass
+    
+    value = probe()
+    
+    if value:
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            cache_file.write_text(json.dumps({'ts': time.time(), 'value': value}),
+                                  encoding='utf-8')
+        except (OSError, TypeError):
+            pass
+    else:
+        try:
+            cache_file.unlink()
+        except OSError:
+            pass
+    
+    return value
+
+
+def _probe_claude():
+    """(path, version) for a working claude CLI, or None"""
+    import subprocess
+    
+    path = which('claude')
+    if not path:
+        return None
+    try:
+        result = subprocess.run([path, '--version'], 
+                              capture_output=True, text=True, timeout=5)
+        if result.returncode == 0:
+            return [path, result.stdout.strip()]
+    except (OSError, subprocess.TimeoutExpired):
+        pass
+    return None
+
+
+def probe_claude(ttl=60, refresh=False):
+    """Locate the claude CLI and read its version, caching a working result on disk.
+    
+    Returns (path, version); path is None if claude is not in PATH and version
+    is None if `claude --version` failed.
+    """
+    found = cached_probe('claude_probe', ttl, _probe_claude, refresh=refresh)
+    if found:
+        return tuple(found)
+    # Not cached: tell "missing" apart from "installed but broken"
+    return which('claude'), None
+
+
+# Parsed templates keyed by path, invalidated when the file's mtime changes
+_TEMPLATE_CACHE = {}
+
+
+def _load_template(path):
+    """Read and parse a script template, reusing it while the file is unchanged"""
+    key = str(path)
+    mtime = os.stat(key).st_mtime_ns
+    
+    cached = _TEMPLATE_CACHE.get(key)
+    if cached is None or cached[0] != mtime:
+        from string import Template
+        # One read and a one-shot decode, rather than a text-mode file's incremental decoder
+        cached = (mtime, Template(Path(key).read_bytes().decode('utf-8')))
+        _TEMPLATE_CACHE[key] = cached
+    
+    return cached[1]
+
+
+def write_atomic(path, data, mode=None):
+    """Write bytes via a synced sibling temp file renamed over `path`, so a crash or a
+    concurrent reader never sees a partial file.
+    
+    `mode` defaults to the existing file's permissions, or 0o644 for a new file.
+    """
+    import tempfile
+    
+    path = os.fspath(path)
+    if mode is None:
+        try:
+            mode = os.stat(path).st_mode & 0o777
+        except FileNotFoundError:
+            mode = 0o644
+    
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path) or os.curdir, prefix='.tmp-')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.chmod(tmp_path, mode)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def tail_lines(path, count, chunk_size=8192):
+    """Return the last `count` lines of a file, reading backwards from the end"""
+    if count <= 0:
+        return []
+    
+    with open(path, 'rb') as f:
+        pos = f.seek(0, os.SEEK_END)
+        data = b''
+        # One extra newline is needed so the first returned line is complete
+        while pos > 0 and data.count(b'\n') <= count:
+            step = min(chunk_size, pos)
+            pos -= step
+            f.seek(pos)
+            data = f.read(step) + data
+    
+    return data.decode('utf-8', errors='replace').splitlines()[-count:]
+
+
 class BaseSchedulerSetup(ABC):
     def __init__(self, config_path='config.json', dry_run=False, verbose=False, 
                  notification_topic=None, remove_notifications=False):
@@ -21,11 +274,13 @@ class BaseSchedulerSetup(ABC):
         self.verbose = verbose
         self.notification_topic = notification_topic
         self.remove_notifications = remove_notifications
-        self.platform = platform.system().lower()
-        self.username = getpass.getuser()
-        self.home_dir = Path.home()
-        self.script_dir = Path(__file__).parent.parent.absolute()
-        self.config_path = self.script_dir / config_path
+        self.platform = _PLATFORM
+        self.username = _get_username()
+        self.home_dir = _HOME_DIR
+        self.script_dir = _SCRIPT_DIR
+        self.config_path = _resolve_config_path(config_path)
+        self._config_dirty = False
+        self._schedule_generated = False
         self.config = self.load_config()
         
         # Handle notification settings
@@ -43,19 +298,25 @@ class BaseSchedulerSetup(ABC):
     
     def load_config(self):
         first_time_setup = False
-        if not self.config_path.exists():
+        # One stat answers "does it exist" and feeds the config cache
+        try:
+            config_stat = os.stat(self.config_path)
+        except FileNotFoundError:
+            config_stat = None
+        
+        if config_stat is None:
             # Try to copy from config.example.json
             example_path = self.script_dir / 'config.example.json'
             if example_path.exists():
                 print("No config.json found. Let's set up your schedule!")
+                import shutil
                 shutil.copy(example_path, self.config_path)
                 first_time_setup = True
             else:
                 print(f"Error: Neither {self.config_path} nor {example_path} found")
                 sys.exit(1)
         
-        with open(self.config_path, 'r', encoding='utf-8') as f:
-            config = json.load(f)
+        config = _load_config_cached(self.config_path, config_stat)
         
         # If first time setup and in simple mode, prompt for start time
         if first_time_setup and 'start_time' in config and 'schedule' not in config:
@@ -77,10 +338,8 @@ class BaseSchedulerSetup(ABC):
                                 for sched in schedule:
                                     print(f"  - {sched['time']}")
                                 print()
-                                # Save the updated config
-                                with open(self.config_path, 'w', encoding='utf-8') as f:
-                                    json.dump(config, f, indent=2)
-                                print(f"Config saved to {self.config_path}\n")
+                                # Written once by run() together with any other config changes
+                                self._config_dirty = True
                                 break
                         except ValueError:
                             pass
@@ -88,9 +347,6 @@ class BaseSchedulerSetup(ABC):
             else:
                 print(f"Created {self.config_path} with default start time {config['start_time']}")
         
-        if self.platform == 'darwin':
-            self.platform = 'macos'
-        
         # Validate command to prevent injection attacks
         self.validate_command(config)
         
@@ -106,72 +362,55 @@ class BaseSchedulerSetup(ABC):
             # Auto mode - generate 4 schedule times from start_time
             print(f"Using SIMPLE mode - generating 4 sessions from {config['start_time']}")
             config['schedule'] = self.generate_schedule_times(config)
+            self._schedule_generated = True
         else:
             print("Error: config.json must contain either 'start_time' (simple mode) or 'schedule' (manual mode)")
             sys.exit(1)
         
+        _annotate_schedule(config['schedule'])
+        
         return config
     
     def validate_command(self, config):
         """Validate command to prevent injection attacks"""
         command = config.get('command', '')
-        
-        # Extract the actual command (first word)
-        cmd_parts = command.split()
-        if not cmd_parts:
-            print("Error: No command specified in config")
-            sys.exit(1)
-        
-        cmd = cmd_parts[0]
-        
-        # Allow full paths to claude executable
-        if '/' in cmd or '\\' in cmd:
-            # It's a path - just ensure it contains 'claude' somewhere
-            if 'claude' not in cmd.lower():
-                print(f"Error: Command path '{cmd}' doesn't appear to be a claude executable")
-                print("For security, only 'claude' commands are allowed")
-                sys.exit(1)
-        else:
-            # It's a command name - must be exactly 'claude'
-            if cmd != 'claude':
-                print(f"Error: Command '{cmd}' is not allowed")
-                print("For security, only 'claude' commands are allowed")
-                sys.exit(1)
+        cmd = self._validate_one(command)
         
         # Also validate Windows command if present
         if self.platform == 'windows' and 'platform_settings' in config:
             win_cmd = config.get('platform_settings', {}).get('windows', {}).get('command', '')
-            if win_cmd and win_cmd != command:
+            if win_cmd.strip() and win_cmd != command:
                 # Windows has a different command, validate it too
-                win_cmd_parts = win_cmd.split()
-                if win_cmd_parts:
-                    win_cmd_name = win_cmd_parts[0]
-                    if '/' in win_cmd_name or '\\' in win_cmd_name:
-                        if 'claude' not in win_cmd_name.lower():
-                            print(f"Error: Windows command path '{win_cmd_name}' doesn't appear to be a claude executable")
-                            sys.exit(1)
-                    elif win_cmd_name != 'claude':
-                        print(f"Error: Windows command '{win_cmd_name}' is not allowed")
-                        sys.exit(1)
+                self._validate_one(win_cmd, label='Windows command')
         
         if self.verbose:
             print(f"Command validation passed: {cmd}")
     
+    def _validate_one(self, command, label='Command'):
+        """Exit unless the command's executable is claude; returns the executable"""
+        cmd_parts = command.split(None, 1)
+        if not cmd_parts:
+            print("Error: No command specified in config")
+            sys.exit(1)
+        
+        cmd = cmd_parts[0]
+        if _CLAUDE_EXE_RE.fullmatch(cmd):
+            return cmd
+        
+        if _PATH_SEPARATOR_RE.search(cmd):
+            print(f"Error: {label} path '{cmd}' doesn't appear to be a claude executable")
+        else:
+            print(f"Error: {label} '{cmd}' is not allowed")
+        print("For security, only 'claude' commands are allowed")
+        sys.exit(1)
+    
     def generate_schedule_times(self, config):
         """Generate 4 schedule times at 5-hour intervals from start_time"""
         start_time_str = config.get('start_time', '06:15')
         wake_minutes = config.get('wake_minutes_before', 5)
         
-        # Parse start time
-        hour, minute = map(int, start_time_str.split(':'))
-        
-        schedules = []
-        for interval in [0, 5, 10, 15]:  # 0, +5h, +10h, +15h
-            new_hour = (hour + interval) % 24
-            schedules.append({
-                'time': f"{new_hour:02d}:{minute:02d}",
-                'wake_minutes_before': wake_minutes
-            })
+        schedules = [{'time': t, 'wake_minutes_before': w}
+                     for t, w in _compute_schedule_times(start_time_str, wake_minutes)]
         
         if self.verbose:
             print(f"Generated schedule times from {start_time_str}:")
@@ -196,25 +435,49 @@ class BaseSchedulerSetup(ABC):
         return logs_dir
     
     def generate_from_template(self, template_path, output_path, substitutions):
+        """Render a template to output_path.
+        
+        Uses safe_substitute, so a placeholder missing from substitutions is left
+        in the output as-is rather than raising - every ${NAME} used by a template
+        must be supplied by the platform's register().
+        """
         if self.verbose:
             print(f"Generating {output_path} from {template_path}")
         
-        with open(template_path, 'r', encoding='utf-8') as f:
-            template = Template(f.read())
-        
-        content = template.safe_substitute(substitutions)
+        content = _load_template(template_path).safe_substitute(substitutions)
         
         if not self.dry_run:
-            with open(output_path, 'w', encoding='utf-8') as f:
-                f.write(content)
-            if self.platform != 'windows':
-                os.chmod(output_path, 0o755)
+            data = content.encode('utf-8')
+            mode = 0o644 if self.platform == 'windows' else 0o755
+            
+            # Re-running setup with an unchanged config is the common case: leave an
+            # identical file alone. Size and mode are compared first, so only a likely
+            # match costs a read.
+            try:
+                st = os.stat(output_path)
+                if (st.st_size == len(data)
+                        and (self.platform == 'windows' or st.st_mode & 0o777 == mode)
+                        and Path(output_path).read_bytes() == data):
+                    if self.verbose:
+                        print(f"  {output_path} is up to date")
+                    return
+            except FileNotFoundError:
+                pass
+            
+            # The temp file gets the final mode before it is renamed into place
+            write_atomic(output_path, data, mode)
     
     def save_config(self):
         """Save the updated config file with notification settings"""
         if not self.dry_run:
-            with open(self.config_path, 'w', encoding='utf-8') as f:
-                json.dump(self.config, f, indent=2)
+            config = dict(self.config)
+            # A schedule generated from start_time is derived data - keep the file in simple mode
+            if self._schedule_generated:
+                config.pop('schedule', None)
+            elif 'schedule' in config:
+                config['schedule'] = [{k: v for k, v in sched.items() if not k.startswith('_')}
+                                      for sched in config['schedule']]
+            write_atomic(self.config_path, json.dumps(config, indent=2).encode('utf-8'))
             if self.verbose:
                 print(f"Configuration saved to {self.config_path}")
     
@@ -235,13 +498,14 @@ class BaseSchedulerSetup(ABC):
         if self.dry_run:
             print("*** DRY RUN MODE - No changes will be made ***\n")
         
+        # Save the chosen start time and notification settings in a single write,
+        # before a failed prerequisite check can discard them
+        if self.notification_topic or self.remove_notifications or self._config_dirty:
+            self.save_config()
+        
         if not self.check_prerequisites():
             sys.exit(1)
         
-        # Save updated config with notification settings
-        if self.notification_topic or self.remove_notifications:
-            self.save_config()
-        
         self.register()
         
         print("\n" + "=" * 50)
@@ -255,19 +519,16 @@ class BaseSchedulerSetup(ABC):
 
 
 class BaseSchedulerStatus(ABC):
-    def __init__(self, config_path='config.json', show_logs=False):
+    def __init__(self, config_path='config.json', show_logs=False, refresh=False):
         self.show_logs = show_logs
-        self.platform = platform.system().lower()
-        self.script_dir = Path(__file__).parent.parent.absolute()
-        self.config_path = self.script_dir / config_path
-        self.home_dir = Path.home()
-        
-        if self.platform == 'darwin':
-            self.platform = 'macos'
+        self.refresh = refresh
+        self.platform = _PLATFORM
+        self.script_dir = _SCRIPT_DIR
+        self.config_path = _resolve_config_path(config_path)
+        self.home_dir = _HOME_DIR
         
         if self.config_path.exists():
-            with open(self.config_path, 'r', encoding='utf-8') as f:
-                self.config = json.load(f)
+            self.config = _load_config_cached(self.config_path)
             
             # Detect configuration mode
             if 'schedule' in self.config:
@@ -281,6 +542,8 @@ class BaseSchedulerStatus(ABC):
         else:
             print("Warning: config.json not found, using defaults")
             self.config = self.get_default_config()
+        
+        _annotate_schedule(self.config['schedule'])
     
     def get_default_config(self):
         config = {
@@ -307,34 +570,27 @@ class BaseSchedulerStatus(ABC):
         start_time_str = config.get('start_time', '06:15')
         wake_minutes = config.get('wake_minutes_before', 5)
         
-        # Parse start time
-        hour, minute = map(int, start_time_str.split(':'))
-        
-        schedules = []
-        for interval in [0, 5, 10, 15]:  # 0, +5h, +10h, +15h
-            new_hour = (hour + interval) % 24
-            schedules.append({
-                'time': f"{new_hour:02d}:{minute:02d}",
-                'wake_minutes_before': wake_minutes
-            })
-        
-        return schedules
+        return [{'time': t, 'wake_minutes_before': w}
+                for t, w in _compute_schedule_times(start_time_str, wake_minutes)]
     
-    def get_next_run_time(self):
-        now = datetime.now()
-        schedule_times = []
+    def get_next_run_time(self, now=None):
+        """The next scheduled run after `now` (default: the current time)"""
+        from datetime import datetime, timedelta
+        
+        if now is None:
+            now = datetime.now()
+        today = now.replace(second=0, microsecond=0)
+        next_run = None
         
         for sched in self.config['schedule']:
-            time_str = sched['time']
-            hour, minute = map(int, time_str.split(':'))
+            candidate = today.replace(hour=sched['_hour'], minute=sched['_minute'])
+            if candidate <= now:
+                candidate += timedelta(days=1)
             
-            next_time = now.replace(hour=hour, minute=minute, second=0, microsecond=0)
-            if next_time <= now:
-                next_time += timedelta(days=1)
-            
-            schedule_times.append(next_time)
+            if next_run is None or candidate < next_run:
+                next_run = candidate
         
-        return min(schedule_times)
+        return next_run
     
     def show_recent_logs(self, lines=20):
         print(f"\n=== Recent Log Entries (last {lines} lines) ===")
@@ -343,65 +599,67 @@ class BaseSchedulerStatus(ABC):
         
         if log_file.exists():
             try:
-                with open(log_file, 'r', encoding='utf-8') as f:
-                    all_lines = f.readlines()
-                    recent_lines = all_lines[-lines:] if len(all_lines) > lines else all_lines
-                    
-                    for line in recent_lines:
-                        print(line.rstrip())
+                recent_lines = tail_lines(log_file, lines)
+                sys.stdout.write(''.join(f"{line.rstrip()}\n" for line in recent_lines))
             except Exception as e:
                 print(f"Error reading log file: {e}")
         else:
             print(f"Log file not found: {log_file}")
     
     def check_claude_availability(self):
-        print("\n=== Claude CLI Check ===")
+        sys.stdout.write(''.join(f"{line}\n" for line in self._claude_availability_lines()))
+    
+    def _claude_availability_lines(self):
+        """The Claude CLI report as a list of lines; prints nothing, so it can run in a worker thread"""
+        out = ["\n=== Claude CLI Check ==="]
         
         if self.platform == 'windows':
-            # Windows requires WSL - check for WSL first
-            wsl_path = shutil.which('wsl')
+            import subprocess
             
-            if not wsl_path:
-                print("X WSL not found")
-                print(f"  Please install WSL and claude within it")
-                return
-            
-            # WSL is available, now check for claude inside WSL with proper PATH
+            # One call checks both WSL and claude inside it: a missing wsl.exe raises
+            # FileNotFoundError, so no separate PATH lookup is needed
             try:
                 # Use the same PATH setup as the PowerShell script
                 wsl_command = "source ~/.bashrc 2>/dev/null; source ~/.nvm/nvm.sh 2>/dev/null; export PATH='$HOME/.nvm/versions/node/v20.19.3/bin:$HOME/.local/bin:$HOME/.npm-global/bin:/usr/local/bin:/usr/bin:/bin'; claude --version"
-                result = subprocess.run([wsl_path, 'bash', '-c', wsl_command], 
-                                      capture_output=True, text=True)
+                # A cold WSL VM can take several seconds to boot; don't let it hang the status check
+                result = subprocess.run(['wsl', 'bash', '-c', wsl_command], 
+                                      capture_output=True, text=True, timeout=10, creationflags=NO_WINDOW)
                 
                 if result.returncode == 0:
-                    print("+ Claude CLI is available through WSL")
+                    out.append("+ Claude CLI is available through WSL")
                     if result.stdout:
-                        print(f"  Version: {result.stdout.strip()}")
+                        out.append(f"  Version: {result.stdout.strip()}")
                 else:
-                    print("X Claude CLI not found in WSL")
-                    print(f"  Please ensure claude is installed inside WSL")
+                    out.append("X Claude CLI not found in WSL")
+                    out.append(f"  Please ensure claude is installed inside WSL")
+            except FileNotFoundError:
+                out.append("X WSL not found")
+                out.append(f"  Please install WSL and claude within it")
+            except subprocess.TimeoutExpired:
+                out.append("X WSL did not respond within 10 seconds")
+                out.append(f"  Please check that WSL starts correctly")
             except Exception as e:
-                print(f"X Error checking claude in WSL: {e}")
-                print(f"  Please ensure claude is installed inside WSL")
+                out.append(f"X Error checking claude in WSL: {e}")
+                out.append(f"  Please ensure claude is installed inside WSL")
         else:
             # macOS and Linux
-            try:
-                result = subprocess.run(['claude', '--version'], 
-                                      capture_output=True, text=True)
-                
-                if result.returncode == 0:
-                    print("+ Claude CLI is available")
-                    if result.stdout:
-                        print(f"  Version: {result.stdout.strip()}")
-                else:
-                    print("X Claude CLI returned error")
-            except FileNotFoundError:
-                print("X Claude CLI not found in PATH")
-                print(f"  Please ensure 'claude' is installed and in your PATH")
+            claude_path, version = probe_claude(refresh=self.refresh)
+            
+            if not claude_path:
+                out.append("X Claude CLI not found in PATH")
+                out.append(f"  Please ensure 'claude' is installed and in your PATH")
+            elif version is not None:
+                out.append("+ Claude CLI is available")
+                if version:
+                    out.append(f"  Version: {version}")
+            else:
+                out.append("X Claude CLI returned error")
+        
+        return out
     
     @abstractmethod
     def check_status(self):
-        """Platform-specific status checking"""
+        """Platform-specific status checking; returns the report as a list of lines"""
         pass
     
     @abstractmethod
@@ -413,35 +671,49 @@ class BaseSchedulerStatus(ABC):
         print("Claude Scheduler Status")
         print("=" * 50)
         
-        self.check_claude_availability()
-        self.check_status()
+        import concurrent.futures
+        
+        # The claude probe (a `claude --version` or a WSL start-up) and the platform checks are
+        # independent, so run them concurrently. Both return their lines, which are printed
+        # claude report first, keeping the usual order.
+        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+            claude_future = executor.submit(self._claude_availability_lines)
+            status_lines = self.check_status()
         
-        print("\n=== Schedule Configuration ===")
+        sys.stdout.write(''.join(f"{line}\n" for line in claude_future.result() + status_lines))
+        
+        # The schedule report is assembled and written in one go
+        out = ["\n=== Schedule Configuration ==="]
         
         mode = self.config.get('mode', 'simple')
         if mode == 'simple':
             start_time = self.config.get('start_time', '06:15')
-            print(f"Mode: SIMPLE (automatic 5-hour intervals)")
-            print(f"Start time: {start_time}")
-            print(f"Sessions repeat every 5 hours (4 sessions per day)")
-            print(f"Wake computer: {self.config.get('wake_minutes_before', 5)} minutes before each session")
+            out.append(f"Mode: SIMPLE (automatic 5-hour intervals)")
+            out.append(f"Start time: {start_time}")
+            out.append(f"Sessions repeat every 5 hours (4 sessions per day)")
+            out.append(f"Wake computer: {self.config.get('wake_minutes_before', 5)} minutes before each session")
         else:
-            print(f"Mode: MANUAL (custom schedule)")
-            print(f"Custom times configured: {len(self.config['schedule'])} sessions")
-            print(f"Wake computer: varies per session")
+            out.append(f"Mode: MANUAL (custom schedule)")
+            out.append(f"Custom times configured: {len(self.config['schedule'])} sessions")
+            out.append(f"Wake computer: varies per session")
         
-        print("\nScheduled times:")
+        out.append("\nScheduled times:")
         for sched in self.config['schedule']:
             wake_mins = sched.get('wake_minutes_before', self.config.get('wake_minutes_before', 5))
-            print(f"  - {sched['time']} (wake {wake_mins} min before)")
+            out.append(f"  - {sched['time']} (wake {wake_mins} min before)")
         
-        next_run = self.get_next_run_time()
-        print(f"\nNext scheduled run: {next_run.strftime('%Y-%m-%d %H:%M:%S')}")
+        # One clock reading for both values, so the countdown matches the run time shown
+        from datetime import datetime
+        now = datetime.now()
+        next_run = self.get_next_run_time(now)
+        out.append(f"\nNext scheduled run: {next_run.strftime('%Y-%m-%d %H:%M:%S')}")
         
-        time_until = next_run - datetime.now()
+        time_until = next_run - now
         hours, remainder = divmod(time_until.seconds, 3600)
         minutes, _ = divmod(remainder, 60)
-        print(f"Time until next run: {hours}h {minutes}m")
+        out.append(f"Time until next run: {hours}h {minutes}m")
+        
+        sys.stdout.write('\n'.join(out) + '\n')
         
         if self.show_logs:
             self.show_recent_logs()
@@ -453,17 +725,13 @@ class BaseSchedulerStatus(ABC):
 class BaseSchedulerUninstall(ABC):
     def __init__(self, config_path='config.json', remove_logs=False):
         self.remove_logs = remove_logs
-        self.platform = platform.system().lower()
-        self.script_dir = Path(__file__).parent.parent.absolute()
-        self.config_path = self.script_dir / config_path
-        self.home_dir = Path.home()
-        
-        if self.platform == 'darwin':
-            self.platform = 'macos'
+        self.platform = _PLATFORM
+        self.script_dir = _SCRIPT_DIR
+        self.config_path = _resolve_config_path(config_path)
+        self.home_dir = _HOME_DIR
         
         if self.config_path.exists():
-            with open(self.config_path, 'r', encoding='utf-8') as f:
-                self.config = json.load(f)
+            self.config = _load_config_cached(self.config_path)
         else:
             print("Warning: config.json not found, using defaults")
             self.config = self.get_default_config()
@@ -485,9 +753,22 @@ class BaseSchedulerUninstall(ABC):
     
     def clean_scripts_directory(self):
         scripts_dir = self.script_dir / 'scripts'
-        if scripts_dir.exists():
-            print(f"Cleaning scripts directory: {scripts_dir}")
-            shutil.rmtree(scripts_dir)
+        try:
+            entries = os.scandir(scripts_dir)
+        except FileNotFoundError:
+            return
+        
+        print(f"Cleaning scripts directory: {scripts_dir}")
+        # The directory is flat (a few generated files), and scandir already knows each
+        # entry's type, so unlink directly; rmtree is only needed for a stray subdirectory
+        with entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    import shutil
+                    shutil.rmtree(entry.path)
+                else:
+                    os.unlink(entry.path)
+        os.rmdir(scripts_dir)
     
     @abstractmethod
     def uninstall(self):
@@ -1,7 +1,13 @@
 #!/usr/bin/env python3
 
-from .setup import LinuxSchedulerSetup
-from .status import LinuxSchedulerStatus
-from .uninstall import LinuxSchedulerUninstall
+from common.base import lazy_exports
 
-__all__ = ['LinuxSchedulerSetup', 'LinuxSchedulerStatus', 'LinuxSchedulerUninstall']
\ No newline at end of file
+_EXPORTS = {
+    'LinuxSchedulerSetup': '.setup',
+    'LinuxSchedulerStatus': '.status',
+    'LinuxSchedulerUninstall': '.uninstall',
+}
+
+__all__ = list(_EXPORTS)
+
+__getattr__ = lazy_exports(__name__, _EXPORTS)
@@ -0,0 +1,24 @@
+#!/usr/bin/env python3
+
+import functools
+from common.base import cached_probe
+
+
+def _probe_systemd():
+    import shutil
+    
+    if shutil.which('systemctl') is None:
+        return False
+    
+    import subprocess
+    
+    # show-environment only succeeds with a live systemd manager, unlike --version
+    return subprocess.run(['systemctl', 'show-environment'], 
+                          stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL).returncode == 0
+
+
+@functools.lru_cache(maxsize=2)
+def has_systemd(refresh=False):
+    """True when a running systemd manager is reachable; probed once per process
+    and remembered on disk for a few minutes (refresh=True ignores the saved result)"""
+    return cached_probe('systemd', 300, _probe_systemd, refresh=refresh)
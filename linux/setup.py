@@ -1,11 +1,27 @@
 #!/usr/bin/env python3
 
-import sys
-import subprocess
-import shutil
-from pathlib import Path
-sys.path.append(str(Path(__file__).parent.parent))
-from common.base import BaseSchedulerSetup
+import functools
+import shlex
+from common.base import BaseSchedulerSetup, which, write_atomic
+from ._detect import has_systemd
+
+
+@functools.lru_cache(maxsize=4)
+def _timer_for(schedule_key, service_name):
+    """Render the systemd timer unit for a tuple of HH:MM schedule times"""
+    on_calendar = "\n".join(f"OnCalendar=*-*-* {time}:00" for time in schedule_key)
+    
+    return f"""[Unit]
+Description=Claude Scheduler Timer
+Requires={service_name}.service
+
+[Timer]
+{on_calendar}
+AccuracySec=1s
+Persistent=true
+
+[Install]
+WantedBy=timers.target"""
 
 
 class LinuxSchedulerSetup(BaseSchedulerSetup):
@@ -19,16 +35,14 @@ class LinuxSchedulerSetup(BaseSchedulerSetup):
         print("Checking prerequisites...")
         
         # Check for claude CLI
-        claude_check = shutil.which('claude')
+        claude_check = which('claude')
         if not claude_check:
             print(f"Error: claude command not found. Please install Claude CLI first.")
             return False
         print("✓ Claude CLI found")
         
-        # Check for systemd or fall back to cron
-        systemd_check = subprocess.run(['systemctl', '--version'], 
-                                      capture_output=True, text=True).returncode == 0
-        if systemd_check:
+        # Check for systemd or fall back to cron; probed afresh, as the choice is written to the system
+        if has_systemd(refresh=True):
             self.linux_method = 'systemd'
         else:
             self.linux_method = 'cron'
@@ -39,36 +53,24 @@ class LinuxSchedulerSetup(BaseSchedulerSetup):
     
     def generate_linux_timer(self, service_name):
         """Generate systemd timer with dynamic schedule times"""
-        on_calendar_entries = []
-        
-        for sched in self.config['schedule']:
-            time = sched['time']
-            on_calendar_entries.append(f"OnCalendar=*-*-* {time}:00")
-        
-        timer_content = f"""[Unit]
-Description=Claude Scheduler Timer
-Requires={service_name}.service
-
-[Timer]
-{chr(10).join(on_calendar_entries)}
-AccuracySec=1s
-Persistent=true
-
-[Install]
-WantedBy=timers.target"""
-        
-        return timer_content
+        schedule_key = tuple(sched['time'] for sched in self.config['schedule'])
+        return _timer_for(schedule_key, service_name)
     
     def register(self):
+        import concurrent.futures
+        import subprocess
+        
         print("\n=== Registering Linux scheduler ===")
         
         scripts_dir = self.create_scripts_directory()
-        self.create_logs_directory()
+        logs_dir = self.create_logs_directory()
         platform_dir = self.script_dir / 'linux'
         
-        schedules = []
-        for sched in self.config['schedule']:
-            schedules.append(sched['time'])
+        schedules = [sched['time'] for sched in self.config['schedule']]
+        
+        script_path = scripts_dir / 'claude_scheduler.sh'
+        service_path = scripts_dir / f'{self.service_name}.service'
+        timer_path = scripts_dir / f'{self.service_name}.timer'
         
         substitutions = {
             'USERNAME': self.username,
@@ -77,52 +79,61 @@ WantedBy=timers.target"""
             'WORKING_DIR_VALUE': self.config.get('working_directory', '~'),
             'SCHEDULES': ' '.join(schedules),
             'SERVICE_NAME': self.service_name,
-            'LOG_DIR': str(self.home_dir / 'logs'),
-            'SCRIPT_PATH': str(scripts_dir / 'claude_scheduler.sh'),
+            'LOG_DIR': str(logs_dir),
+            'SCRIPT_PATH': str(script_path),
             'NTFY_TOPIC': self.config.get('notification_topic', '')
         }
         
-        self.generate_from_template(
-            platform_dir / 'scheduler.sh.template',
-            scripts_dir / 'claude_scheduler.sh',
-            substitutions
-        )
-        
-        if self.linux_method == 'systemd':
-            self.generate_from_template(
-                platform_dir / 'claude-scheduler.service.template',
-                scripts_dir / f'{self.service_name}.service',
+        # The generated files are independent, so write them concurrently
+        with concurrent.futures.ThreadPoolExecutor(max_workers=3) as executor:
+            jobs = [executor.submit(
+                self.generate_from_template,
+                platform_dir / 'scheduler.sh.template',
+                script_path,
                 substitutions
-            )
-            
-            # Generate timer with dynamic schedule times
-            timer_content = self.generate_linux_timer(self.service_name)
+            )]
             
-            if not self.dry_run:
-                timer_path = scripts_dir / f'{self.service_name}.timer'
-                with open(timer_path, 'w', encoding='utf-8') as f:
-                    f.write(timer_content)
-            else:
-                if self.verbose:
-                    print(f"Would generate timer at: {scripts_dir / f'{self.service_name}.timer'}")
+            if self.linux_method == 'systemd':
+                jobs.append(executor.submit(
+                    self.generate_from_template,
+                    platform_dir / 'claude-scheduler.service.template',
+                    service_path,
+                    substitutions
+                ))
+                
+                # Generate timer with dynamic schedule times
+                if not self.dry_run:
+                    jobs.append(executor.submit(
+                        write_atomic,
+                        timer_path,
+                        self.generate_linux_timer(self.service_name).encode('utf-8')
+                    ))
+        
+        # Re-raise any write error from the worker threads
+        for job in jobs:
+            job.result()
+        
+        if self.linux_method == 'systemd':
+            if self.dry_run and self.verbose:
+                print(f"Would generate timer at: {timer_path}")
             
             if not self.dry_run:
                 print("\nRegistering with systemd (requires sudo)...")
-                service_path = scripts_dir / f'{self.service_name}.service'
-                timer_path = scripts_dir / f'{self.service_name}.timer'
                 
-                print("• Copying systemd service and timer files...")
-                subprocess.run(['sudo', 'cp', str(service_path), 
-                              f'/etc/systemd/system/{self.service_name}.service'], check=True)
-                subprocess.run(['sudo', 'cp', str(timer_path), 
-                              f'/etc/systemd/system/{self.service_name}.timer'], check=True)
+                unit_dir = '/etc/systemd/system'
+                timer_unit = shlex.quote(f'{self.service_name}.timer')
                 
-                print("• Reloading systemd configuration...")
-                subprocess.run(['sudo', 'systemctl', 'daemon-reload'], check=True)
+                # One sudo invocation for the whole install: a single auth prompt and fork
+                install_cmd = ' && '.join([
+                    f"cp {shlex.quote(str(service_path))} {shlex.quote(f'{unit_dir}/{self.service_name}.service')}",
+                    f"cp {shlex.quote(str(timer_path))} {shlex.quote(f'{unit_dir}/{self.service_name}.timer')}",
+                    "systemctl daemon-reload",
+                    f"systemctl enable {timer_unit}",
+                    f"systemctl start {timer_unit}",
+                ])
                 
-                print("• Enabling and starting timer...")
-                subprocess.run(['sudo', 'systemctl', 'enable', f'{self.service_name}.timer'], check=True)
-                subprocess.run(['sudo', 'systemctl', 'start', f'{self.service_name}.timer'], check=True)
+                print("• Copying systemd service and timer files, reloading systemd, enabling and starting timer...")
+                subprocess.run(['sudo', 'sh', '-c', install_cmd], check=True)
                 
                 if self.config.get('enable_wake', False) and self.config['platform_settings']['linux'].get('wake_method') == 'rtcwake':
                     print("• Note: rtcwake must be configured manually (see SETUP.md)")
@@ -131,22 +142,23 @@ WantedBy=timers.target"""
         else:
             if not self.dry_run:
                 print("\nRegistering with cron...")
-                cron_entry = ""
-                for sched in self.config['schedule']:
-                    hour, minute = sched['time'].split(':')
-                    cron_entry += f"{minute} {hour} * * * {scripts_dir}/claude_scheduler.sh\n"
+                cron_entries = "".join(
+                    f"{sched['_minute']} {sched['_hour']} * * * {script_path}\n"
+                    for sched in self.config['schedule']
+                ).encode()
                 
                 print("• Reading existing crontab...")
-                cron_process = subprocess.Popen(['crontab', '-l'], 
-                                               stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-                current_cron, _ = cron_process.communicate()
+                # Exits non-zero with empty output when the user has no crontab yet
+                current_cron = subprocess.run(['crontab', '-l'], stdout=subprocess.PIPE, 
+                                              stderr=subprocess.DEVNULL).stdout
+                # Drop entries from a previous setup run so re-running doesn't duplicate them
+                kept = b"".join(line for line in current_cron.splitlines(keepends=True)
+                                if b'claude_scheduler.sh' not in line)
+                if kept and not kept.endswith(b'\n'):
+                    kept += b'\n'
                 
                 print("• Adding scheduler entries...")
-                new_cron = current_cron.decode() + cron_entry
-                
-                cron_process = subprocess.Popen(['crontab', '-'], 
-                                               stdin=subprocess.PIPE, stdout=subprocess.PIPE)
-                cron_process.communicate(input=new_cron.encode())
+                subprocess.run(['crontab', '-'], input=kept + cron_entries, check=True)
                 
                 print("Linux cron scheduler registered successfully!")
         
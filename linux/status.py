@@ -1,66 +1,81 @@
 #!/usr/bin/env python3
 
-import sys
-import subprocess
 import os
-import stat
-from pathlib import Path
-sys.path.append(str(Path(__file__).parent.parent))
-from common.base import BaseSchedulerStatus
+import re
+from common.base import BaseSchedulerStatus, tail_lines
+from ._detect import has_systemd
+
+
+# key=value lines from `systemctl show`
+_PROPERTY_RE = re.compile(r'^(\w+)=(.*)$', re.MULTILINE)
+
+# How long test_script waits for the scheduler script before calling it a success
+_TEST_PROBE_SECONDS = 0.5
+
+# How long a stopped test script gets to exit on SIGTERM before it is killed
+_TERM_GRACE_SECONDS = 2
 
 
 class LinuxSchedulerStatus(BaseSchedulerStatus):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
+        self.script_path = self.script_dir / 'scripts' / 'claude_scheduler.sh'
+        self.log_file = self.home_dir / 'logs' / 'claude_scheduler.log'
         if hasattr(self, 'config') and 'platform_settings' in self.config:
             self.service_name = self.config['platform_settings']['linux'].get('service_name', 'claude-scheduler')
     
     def check_status(self):
-        print("\n=== Linux Scheduler Status ===")
+        import subprocess
         
-        systemd_check = subprocess.run(['systemctl', '--version'], 
-                                      capture_output=True, text=True).returncode == 0
+        out = ["\n=== Linux Scheduler Status ==="]
         
-        if systemd_check:
+        if has_systemd(refresh=self.refresh):
             try:
-                timer_status = subprocess.run(['systemctl', 'status', f'{self.service_name}.timer'], 
-                                            capture_output=True, text=True)
+                timer_unit = f'{self.service_name}.timer'
+                service_unit = f'{self.service_name}.service'
                 
-                if 'active (waiting)' in timer_status.stdout or 'active (running)' in timer_status.stdout:
-                    print(f"✓ Systemd timer '{self.service_name}.timer' is active")
-                    
-                    for line in timer_status.stdout.split('\n'):
-                        if 'Trigger:' in line:
-                            print(f"  {line.strip()}")
-                        elif 'Active:' in line:
-                            print(f"  {line.strip()}")
-                else:
-                    print(f"✗ Systemd timer '{self.service_name}.timer' is not active")
+                # One call returns key=value blocks for both units, separated by a blank line
+                result = subprocess.run(['systemctl', 'show', 
+                                         '--property=LoadState,ActiveState,SubState,NextElapseUSecRealtime,MainPID',
+                                         '--', timer_unit, service_unit], 
+                                        capture_output=True, text=True, check=True)
+                blocks = result.stdout.split('\n\n')
+                timer = dict(_PROPERTY_RE.findall(blocks[0]))
+                service = dict(_PROPERTY_RE.findall(blocks[1])) if len(blocks) > 1 else {}
                 
-                service_status = subprocess.run(['systemctl', 'status', f'{self.service_name}.service'], 
-                                              capture_output=True, text=True)
+                if timer.get('ActiveState') == 'active' and timer.get('SubState') in ('waiting', 'running'):
+                    out.append(f"✓ Systemd timer '{timer_unit}' is active")
+                    out.append(f"  Active: {timer['ActiveState']} ({timer['SubState']})")
+                    if timer.get('NextElapseUSecRealtime'):
+                        out.append(f"  Trigger: {timer['NextElapseUSecRealtime']}")
+                else:
+                    out.append(f"✗ Systemd timer '{timer_unit}' is not active")
                 
-                for line in service_status.stdout.split('\n'):
-                    if 'Main PID:' in line or 'Active:' in line:
-                        print(f"  {line.strip()}")
+                if service.get('LoadState') == 'loaded':
+                    out.append(f"  Service Active: {service.get('ActiveState')} ({service.get('SubState')})")
+                    if service.get('MainPID', '0') != '0':
+                        out.append(f"  Main PID: {service['MainPID']}")
                 
             except subprocess.CalledProcessError:
-                print(f"✗ Service '{self.service_name}' not found")
+                out.append(f"✗ Service '{self.service_name}' not found")
         else:
             try:
                 cron_result = subprocess.run(['crontab', '-l'], 
                                            capture_output=True, text=True)
                 
-                if 'claude_scheduler.sh' in cron_result.stdout:
-                    print("✓ Cron entries are registered")
-                    print("\nCron schedule:")
-                    for line in cron_result.stdout.split('\n'):
-                        if 'claude_scheduler.sh' in line:
-                            print(f"  {line}")
+                cron_lines = [line for line in cron_result.stdout.splitlines() 
+                              if 'claude_scheduler.sh' in line]
+                if cron_lines:
+                    out.append("✓ Cron entries are registered")
+                    out.append("\nCron schedule:")
+                    for line in cron_lines:
+                        out.append(f"  {line}")
                 else:
-                    print("✗ No cron entries found")
-            except:
-                print("✗ Unable to check cron status")
+                    out.append("✗ No cron entries found")
+            except FileNotFoundError:
+                out.append("✗ Unable to check cron status")
+        
+        return out
     
     def test_script(self):
         """Test run the scheduler script to verify it works"""
@@ -68,10 +83,16 @@ class LinuxSchedulerStatus(BaseSchedulerStatus):
         print("=" * 50)
         print("\n=== Testing Linux Scheduler Script ===\n")
         
+        import signal
+        import subprocess
+        
         # Check for script
-        script_path = self.script_dir / 'scripts' / 'claude_scheduler.sh'
+        script_path = self.script_path
         
-        if not script_path.exists():
+        # One stat answers both "does it exist" and "is it executable"
+        try:
+            mode = script_path.stat().st_mode
+        except FileNotFoundError:
             print(f"✗ Script not found: {script_path}")
             print("\nSolution: Run 'python3 setup.py' to generate the script")
             return
@@ -79,19 +100,14 @@ class LinuxSchedulerStatus(BaseSchedulerStatus):
         print(f"✓ Script found: {script_path}")
         
         # Check script permissions
-        try:
-            st = os.stat(script_path)
-            mode = st.st_mode
-            is_executable = bool(mode & stat.S_IXUSR)
-            
-            print(f"\nScript permissions: {oct(stat.S_IMODE(mode))}")
-            if is_executable:
-                print("✓ Script is executable")
-            else:
-                print("✗ Script is not executable")
-                print(f"\nFix with: chmod +x {script_path}")
-        except Exception as e:
-            print(f"Error checking permissions: {e}")
+        is_executable = bool(mode & 0o100)  # owner execute bit
+        
+        print(f"\nScript permissions: {mode & 0o777:03o}")
+        if is_executable:
+            print("✓ Script is executable")
+        else:
+            print("✗ Script is not executable")
+            print(f"\nFix with: chmod +x {script_path}")
         
         # Test run the script
         print("\n" + "=" * 30)
@@ -99,15 +115,31 @@ class LinuxSchedulerStatus(BaseSchedulerStatus):
         print("=" * 30 + "\n")
         
         try:
-            # Run with a 5 second timeout
-            result = subprocess.run(
+            process = subprocess.Popen(
                 ['/bin/bash', str(script_path)],
-                capture_output=True,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
                 text=True,
-                timeout=5,
-                env={**os.environ, 'PATH': '/usr/local/bin:/usr/bin:/bin:' + os.environ.get('PATH', '')}
+                env={**os.environ, 'PATH': '/usr/local/bin:/usr/bin:/bin:' + os.environ.get('PATH', '')},
+                start_new_session=True
             )
             
+            # Early failures (bad directory, missing command) exit almost immediately;
+            # anything still running after the probe window is treated as working
+            try:
+                stdout, stderr = process.communicate(timeout=_TEST_PROBE_SECONDS)
+            except subprocess.TimeoutExpired:
+                # Stop the whole process group - children would otherwise hold the pipes open
+                os.killpg(process.pid, signal.SIGTERM)
+                try:
+                    process.communicate(timeout=_TERM_GRACE_SECONDS)
+                except subprocess.TimeoutExpired:
+                    # SIGTERM trapped or ignored
+                    os.killpg(process.pid, signal.SIGKILL)
+                    process.communicate()
+                raise
+            result = subprocess.CompletedProcess(process.args, process.returncode, stdout, stderr)
+            
             if result.returncode == 0:
                 print("✓ Script executed successfully!")
                 if result.stdout:
@@ -130,8 +162,8 @@ class LinuxSchedulerStatus(BaseSchedulerStatus):
                     print(result.stderr)
                     
         except subprocess.TimeoutExpired:
-            print("✓ Script is running (timed out after 5 seconds - this is normal)")
-            print("The script appears to be working but takes longer than 5 seconds to complete.")
+            print(f"✓ Script is running (stopped after {_TEST_PROBE_SECONDS} seconds - this is normal)")
+            print(f"The script appears to be working but takes longer than {_TEST_PROBE_SECONDS} seconds to complete.")
         except FileNotFoundError:
             print("✗ bash not found")
         except Exception as e:
@@ -142,16 +174,14 @@ class LinuxSchedulerStatus(BaseSchedulerStatus):
         print("Checking log files...")
         print("=" * 30 + "\n")
         
-        log_file = self.home_dir / 'logs' / 'claude_scheduler.log'
+        log_file = self.log_file
         
         if log_file.exists():
             print(f"✓ Log file found: {log_file}")
             try:
-                # Show last few lines
-                with open(log_file, 'r', encoding='utf-8') as f:
-                    lines = f.readlines()
-                    if lines:
-                        print(f"  Last entry: {lines[-1].strip()}")
+                lines = tail_lines(log_file, 1)
+                if lines:
+                    print(f"  Last entry: {lines[-1].strip()}")
             except PermissionError:
                 print(f"  (Permission denied reading log)")
         else:
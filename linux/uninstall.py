@@ -1,10 +1,8 @@
 #!/usr/bin/env python3
 
-import sys
-import subprocess
-from pathlib import Path
-sys.path.append(str(Path(__file__).parent.parent))
+import shlex
 from common.base import BaseSchedulerUninstall
+from ._detect import has_systemd
 
 
 class LinuxSchedulerUninstall(BaseSchedulerUninstall):
@@ -16,28 +14,22 @@ class LinuxSchedulerUninstall(BaseSchedulerUninstall):
     def uninstall(self):
         print("\n=== Uninstalling Linux scheduler ===")
         
-        systemd_check = subprocess.run(['systemctl', '--version'], 
-                                      capture_output=True, text=True).returncode == 0
+        import subprocess
         
-        if systemd_check:
+        # Probed afresh, so a stale result can't leave the other backend's entries behind
+        if has_systemd(refresh=True):
             try:
-                print("Stopping and disabling systemd timer...")
-                subprocess.run(['sudo', 'systemctl', 'stop', f'{self.service_name}.timer'], 
-                              capture_output=True, text=True)
-                subprocess.run(['sudo', 'systemctl', 'disable', f'{self.service_name}.timer'], 
-                              capture_output=True, text=True)
+                timer_unit = shlex.quote(f'{self.service_name}.timer')
+                service_file = shlex.quote(f'/etc/systemd/system/{self.service_name}.service')
+                timer_file = shlex.quote(f'/etc/systemd/system/{self.service_name}.timer')
                 
-                print("Removing systemd service and timer files...")
-                service_file = f'/etc/systemd/system/{self.service_name}.service'
-                timer_file = f'/etc/systemd/system/{self.service_name}.timer'
+                # One sudo invocation: disable --now stops and disables together (failure is fine if
+                # the timer is already gone), and rm -f ignores unit files that no longer exist
+                uninstall_cmd = (f"systemctl disable --now {timer_unit} >/dev/null 2>&1; "
+                                 f"rm -f -- {service_file} {timer_file} && systemctl daemon-reload")
                 
-                if Path(service_file).exists():
-                    subprocess.run(['sudo', 'rm', service_file], check=True)
-                if Path(timer_file).exists():
-                    subprocess.run(['sudo', 'rm', timer_file], check=True)
-                
-                print("Reloading systemd configuration...")
-                subprocess.run(['sudo', 'systemctl', 'daemon-reload'], check=True)
+                print("Stopping and disabling systemd timer, removing unit files, reloading systemd...")
+                subprocess.run(['sudo', 'sh', '-c', uninstall_cmd], check=True)
                 
                 print("Linux systemd timer removed successfully!")
                 
@@ -47,23 +39,21 @@ class LinuxSchedulerUninstall(BaseSchedulerUninstall):
         else:
             try:
                 print("Removing cron entries...")
-                cron_process = subprocess.Popen(['crontab', '-l'], 
-                                               stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-                current_cron, _ = cron_process.communicate()
+                # Filtered as bytes, like setup does - no decode/encode round-trip
+                current_cron = subprocess.run(['crontab', '-l'], stdout=subprocess.PIPE, 
+                                              stderr=subprocess.DEVNULL).stdout
                 
-                lines = current_cron.decode().split('\n')
-                filtered_lines = [line for line in lines 
-                                if 'claude_scheduler.sh' not in line and line.strip()]
-                new_cron = '\n'.join(filtered_lines)
+                new_cron = b''.join(line for line in current_cron.splitlines(keepends=True) 
+                                    if line.strip() and b'claude_scheduler.sh' not in line)
                 
-                if new_cron.strip():
+                if new_cron:
                     print("Updating crontab...")
-                    cron_process = subprocess.Popen(['crontab', '-'], 
-                                                   stdin=subprocess.PIPE, stdout=subprocess.PIPE)
-                    cron_process.communicate(input=new_cron.encode())
+                    if not new_cron.endswith(b'\n'):
+                        new_cron += b'\n'
+                    subprocess.run(['crontab', '-'], input=new_cron, check=True)
                 else:
                     print("Removing empty crontab...")
-                    subprocess.run(['crontab', '-r'], capture_output=True, text=True)
+                    subprocess.run(['crontab', '-r'], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
                 
                 print("Linux cron entries removed successfully!")
                 
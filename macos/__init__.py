@@ -1,7 +1,13 @@
 #!/usr/bin/env python3
 
-from .setup import MacOSSchedulerSetup
-from .status import MacOSSchedulerStatus
-from .uninstall import MacOSSchedulerUninstall
+from common.base import lazy_exports
 
-__all__ = ['MacOSSchedulerSetup', 'MacOSSchedulerStatus', 'MacOSSchedulerUninstall']
\ No newline at end of file
+_EXPORTS = {
+    'MacOSSchedulerSetup': '.setup',
+    'MacOSSchedulerStatus': '.status',
+    'MacOSSchedulerUninstall': '.uninstall',
+}
+
+__all__ = list(_EXPORTS)
+
+__getattr__ = lazy_exports(__name__, _EXPORTS)
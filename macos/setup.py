@@ -1,25 +1,45 @@
 #!/usr/bin/env python3
 
-import sys
-import subprocess
-import shutil
-from pathlib import Path
-sys.path.append(str(Path(__file__).parent.parent))
-from common.base import BaseSchedulerSetup
+from collections import namedtuple
+from common.base import BaseSchedulerSetup, which, write_atomic
+
+
+# A schedule entry with its derived values: minutes from midnight and the HH:MM wake time
+_ScheduleSlot = namedtuple('_ScheduleSlot', ['hour', 'minute', 'minutes', 'wake_offset', 'wake_time'])
+
+
+def _parse_slot(sched):
+    hour, minute = sched['_hour'], sched['_minute']
+    minutes = hour * 60 + minute
+    # Raw offset: 0 when the entry doesn't set one (wake_time still uses the default 5)
+    wake_offset = sched.get('wake_minutes_before', 0)
+    # load_config already wrapped the wake time around midnight, e.g. 00:02 wakes at 23:57
+    return _ScheduleSlot(hour, minute, minutes, wake_offset,
+                         f"{sched['_wake_hour']:02d}:{sched['_wake_minute']:02d}")
 
 
 class MacOSSchedulerSetup(BaseSchedulerSetup):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
+        # Use standard macOS directories
+        self.app_support_dir = self.home_dir / 'Library' / 'Application Support' / 'ClaudeScheduler'
+        self.log_dir = self.home_dir / 'Library' / 'Logs' / 'ClaudeScheduler'
         if hasattr(self, 'config') and 'platform_settings' in self.config:
             self.daemon_label = self.config['platform_settings']['macos'].get('daemon_label', 'ClaudeScheduler')
             self.username = self.config['platform_settings']['macos'].get('username', self.username)
+        if hasattr(self, 'config'):
+            # Parse every schedule entry once; the plists and both wake loops in register() reuse it
+            self._slots = [_parse_slot(sched) for sched in self.config['schedule']]
+            self._calendar_intervals = [{'Hour': slot.hour, 'Minute': slot.minute} for slot in self._slots]
+            # Time-ordered view for finding today's remaining sessions with a bisect
+            self._sorted_slots = sorted(self._slots, key=lambda slot: slot.minutes)
+            self._sorted_minutes = [slot.minutes for slot in self._sorted_slots]
     
     def check_prerequisites(self):
         print("Checking prerequisites...")
         
         # Check for claude CLI
-        claude_check = shutil.which('claude')
+        claude_check = which('claude')
         if not claude_check:
             print(f"Error: claude command not found. Please install Claude CLI first.")
             return False
@@ -30,104 +50,65 @@ class MacOSSchedulerSetup(BaseSchedulerSetup):
     
     def generate_wake_daemon_plist(self, daemon_label, script_path):
         """Generate LaunchDaemon plist for wake scheduling only"""
-        schedule_entries = []
-        
-        # Add schedule entries for wake refresh times (same as Claude execution times)
-        for sched in self.config['schedule']:
-            time_parts = sched['time'].split(':')
-            hour = int(time_parts[0])
-            minute = int(time_parts[1])
-            
-            schedule_entries.append(f"""        <dict>
-            <key>Hour</key>
-            <integer>{hour}</integer>
-            <key>Minute</key>
-            <integer>{minute}</integer>
-        </dict>""")
-        
-        plist_content = f"""<?xml version="1.0" encoding="UTF-8"?>
-<!DOCTYPE plist PUBLIC "-//Apple//DTD PLIST 1.0//EN" "http://www.apple.com/DTDs/PropertyList-1.0.dtd">
-<plist version="1.0">
-<dict>
-    <key>Label</key>
-    <string>{daemon_label}.Wake</string>
-    
-    <key>ProgramArguments</key>
-    <array>
-        <string>/bin/bash</string>
-        <string>{script_path}</string>
-    </array>
-    
-    <key>RunAtLoad</key>
-    <false/>
-    
-    <key>StartCalendarInterval</key>
-    <array>
-{chr(10).join(schedule_entries)}
-    </array>
-    
-    <key>StandardOutPath</key>
-    <string>{str(Path.home() / 'Library' / 'Logs' / 'ClaudeScheduler' / 'wake_daemon.out')}</string>
-    <key>StandardErrorPath</key>
-    <string>{str(Path.home() / 'Library' / 'Logs' / 'ClaudeScheduler' / 'wake_daemon.err')}</string>
-</dict>
-</plist>"""
-        
-        return plist_content
+        # Wake refresh times are the same as Claude execution times
+        return self._render_plist(f'{daemon_label}.Wake', script_path, 'wake_daemon')
     
     def generate_agent_plist(self, agent_label, script_path):
         """Generate LaunchAgent plist for Claude execution"""
-        schedule_entries = []
-        
-        # Add schedule entries for Claude execution times
-        for sched in self.config['schedule']:
-            time_parts = sched['time'].split(':')
-            hour = int(time_parts[0])
-            minute = int(time_parts[1])
-            
-            schedule_entries.append(f"""        <dict>
-            <key>Hour</key>
-            <integer>{hour}</integer>
-            <key>Minute</key>
-            <integer>{minute}</integer>
-        </dict>""")
-        
-        plist_content = f"""<?xml version="1.0" encoding="UTF-8"?>
-<!DOCTYPE plist PUBLIC "-//Apple//DTD PLIST 1.0//EN" "http://www.apple.com/DTDs/PropertyList-1.0.dtd">
-<plist version="1.0">
-<dict>
-    <key>Label</key>
-    <string>{agent_label}.Agent</string>
-    
-    <key>ProgramArguments</key>
-    <array>
-        <string>/bin/bash</string>
-        <string>{script_path}</string>
-    </array>
+        return self._render_plist(f'{agent_label}.Agent', script_path, 'agent')
     
-    <key>RunAtLoad</key>
-    <false/>
+    def _render_plist(self, label, script_path, log_name):
+        """Serialize a launchd plist as binary plist bytes; logs go to <log_name>.out/.err"""
+        import plistlib
+        
+        plist = {
+            'Label': label,
+            'ProgramArguments': ['/bin/bash', script_path],
+            'RunAtLoad': False,
+            'StartCalendarInterval': self._calendar_intervals,
+            'StandardOutPath': str(self.log_dir / f'{log_name}.out'),
+            'StandardErrorPath': str(self.log_dir / f'{log_name}.err')
+        }
+        # Binary plists are smaller and cheaper for launchd to load; launchctl accepts either format
+        return plistlib.dumps(plist, fmt=plistlib.FMT_BINARY, sort_keys=False)
     
-    <key>StartCalendarInterval</key>
-    <array>
-{chr(10).join(schedule_entries)}
-    </array>
+    def _install_wake_daemon(self, wake_daemon_plist_path):
+        """Install and load the wake LaunchDaemon (system-level, requires sudo)"""
+        import shlex
+        import subprocess
+        
+        system_wake_plist = shlex.quote(f'/Library/LaunchDaemons/{self.daemon_label}.Wake.plist')
+        
+        # install(1) copies, chowns and chmods; launchctl loads - both in one privileged shell
+        install_cmd = (f"install -o root -g wheel -m 644 {shlex.quote(str(wake_daemon_plist_path))} {system_wake_plist}"
+                       f" && launchctl load {system_wake_plist}")
+        subprocess.run(['sudo', 'sh', '-c', install_cmd], check=True)
     
-    <key>StandardOutPath</key>
-    <string>{str(Path.home() / 'Library' / 'Logs' / 'ClaudeScheduler' / 'agent.out')}</string>
-    <key>StandardErrorPath</key>
-    <string>{str(Path.home() / 'Library' / 'Logs' / 'ClaudeScheduler' / 'agent.err')}</string>
-</dict>
-</plist>"""
+    def _install_agent(self, agent_plist_path):
+        """Install and load the Claude LaunchAgent (user-level, no sudo needed)"""
+        import shutil
+        import subprocess
+        
+        user_agents_dir = self.home_dir / 'Library' / 'LaunchAgents'
+        user_agents_dir.mkdir(parents=True, exist_ok=True)
+        user_agent_plist = user_agents_dir / f'{self.daemon_label}.Agent.plist'
         
-        return plist_content
+        shutil.copy(str(agent_plist_path), str(user_agent_plist))
+        subprocess.run(['launchctl', 'load', str(user_agent_plist)], check=True)
     
     def register(self):
         print("\n=== Registering macOS scheduler ===")
         
-        # Use standard macOS directories
-        app_support_dir = Path.home() / 'Library' / 'Application Support' / 'ClaudeScheduler'
-        log_dir = Path.home() / 'Library' / 'Logs' / 'ClaudeScheduler'
+        # Only needed here - keeps importing the class cheap
+        import bisect
+        import concurrent.futures
+        import shlex
+        import subprocess
+        from datetime import datetime, timedelta
+        
+        app_support_dir = self.app_support_dir
+        log_dir = self.log_dir
+        enable_wake = self.config.get('enable_wake', False)
         
         # Create directories
         if not self.dry_run:
@@ -139,31 +120,21 @@ class MacOSSchedulerSetup(BaseSchedulerSetup):
         scripts_dir = app_support_dir
         platform_dir = self.script_dir / 'macos'
         
-        wake_schedules = []
-        schedule_times_minutes = []
+        wake_script_path = scripts_dir / 'wake_daemon.sh'
+        agent_script_path = scripts_dir / 'claude_agent.sh'
+        wake_daemon_plist_path = scripts_dir / f'{self.daemon_label}.Wake.plist'
+        agent_plist_path = scripts_dir / f'{self.daemon_label}.Agent.plist'
+        
+        slots = self._slots
         wake_minutes = 5  # Default wake minutes before
         
-        for sched in self.config['schedule']:
-            time_parts = sched['time'].split(':')
-            hour = int(time_parts[0])
-            minute = int(time_parts[1])
-            
-            # Calculate minutes from midnight for schedule times
-            schedule_times_minutes.append(str(hour * 60 + minute))
-            
-            if self.config.get('enable_wake', False) and sched.get('wake_minutes_before', 0) > 0:
-                wake_minutes = sched.get('wake_minutes_before', 5)
-                wake_minute = minute - wake_minutes
-                wake_hour = hour
-                if wake_minute < 0:
-                    wake_minute += 60
-                    wake_hour -= 1
-                    if wake_hour < 0:
-                        wake_hour += 24
-                wake_schedules.append(f"{wake_hour:02d}:{wake_minute:02d}")
+        for slot in slots:
+            # Entries without wake_minutes_before keep the previous entry's offset
+            if enable_wake and slot.wake_offset > 0:
+                wake_minutes = slot.wake_offset
         
-        # Build schedule times array string for bash
-        schedule_times_str = ' '.join(f'"{t}"' for t in schedule_times_minutes)
+        # Build schedule times array string for bash (minutes from midnight)
+        schedule_times_str = ' '.join(f'"{slot.minutes}"' for slot in slots)
         
         substitutions = {
             'USERNAME': self.username,
@@ -172,9 +143,8 @@ class MacOSSchedulerSetup(BaseSchedulerSetup):
             'WORKING_DIR_VALUE': self.config.get('working_directory', '~'),
             'DAEMON_LABEL': self.daemon_label,
             'LOG_DIR': str(log_dir),
-            'SCRIPT_PATH': str(scripts_dir / 'claude_daemon.sh'),
             'NTFY_TOPIC': self.config.get('notification_topic', ''),
-            'ENABLE_WAKE': 'true' if self.config.get('enable_wake', False) else 'false',
+            'ENABLE_WAKE': 'true' if enable_wake else 'false',
             'WAKE_MINUTES': str(wake_minutes),
             'SCHEDULE_TIMES': schedule_times_str
         }
@@ -182,128 +152,89 @@ class MacOSSchedulerSetup(BaseSchedulerSetup):
         # Generate wake daemon script (for pmset only)
         self.generate_from_template(
             platform_dir / 'wake_daemon.sh.template',
-            scripts_dir / 'wake_daemon.sh',
+            wake_script_path,
             substitutions
         )
         
         # Generate agent script (for Claude execution)
         self.generate_from_template(
             platform_dir / 'agent.sh.template',
-            scripts_dir / 'claude_agent.sh',
+            agent_script_path,
             substitutions
         )
         
         # Generate wake daemon plist
         wake_daemon_plist_content = self.generate_wake_daemon_plist(
             self.daemon_label,
-            str(scripts_dir / 'wake_daemon.sh')
+            str(wake_script_path)
         )
         
         # Generate agent plist
         agent_plist_content = self.generate_agent_plist(
             self.daemon_label,
-            str(scripts_dir / 'claude_agent.sh')
+            str(agent_script_path)
         )
         
         if not self.dry_run:
             # Write wake daemon plist
-            wake_daemon_plist_path = scripts_dir / f'{self.daemon_label}.Wake.plist'
-            with open(wake_daemon_plist_path, 'w', encoding='utf-8') as f:
-                f.write(wake_daemon_plist_content)
+            write_atomic(wake_daemon_plist_path, wake_daemon_plist_content)
             
             # Write agent plist
-            agent_plist_path = scripts_dir / f'{self.daemon_label}.Agent.plist'
-            with open(agent_plist_path, 'w', encoding='utf-8') as f:
-                f.write(agent_plist_content)
+            write_atomic(agent_plist_path, agent_plist_content)
         else:
             if self.verbose:
-                print(f"Would generate wake daemon plist at: {scripts_dir / f'{self.daemon_label}.Wake.plist'}")
-                print(f"Would generate agent plist at: {scripts_dir / f'{self.daemon_label}.Agent.plist'}")
+                print(f"Would generate wake daemon plist at: {wake_daemon_plist_path}")
+                print(f"Would generate agent plist at: {agent_plist_path}")
         
         if not self.dry_run:
             print("\nRegistering schedulers...")
             
-            # 1. Install Wake Daemon (system-level, requires sudo)
-            if self.config.get('enable_wake', False):
+            if enable_wake:
+                # Authenticate once up front; the privileged calls below reuse the cached credentials
+                subprocess.run(['sudo', '-v'], check=True)
                 print("\n• Installing wake daemon (requires sudo)...")
-                wake_daemon_plist_path = scripts_dir / f'{self.daemon_label}.Wake.plist'
-                system_wake_plist = Path(f'/Library/LaunchDaemons/{self.daemon_label}.Wake.plist')
-                
-                print("  - Copying wake daemon plist to LaunchDaemons...")
-                subprocess.run(['sudo', 'cp', str(wake_daemon_plist_path), str(system_wake_plist)], check=True)
-                subprocess.run(['sudo', 'chown', 'root:wheel', str(system_wake_plist)], check=True)
-                subprocess.run(['sudo', 'chmod', '644', str(system_wake_plist)], check=True)
-                
-                print("  - Loading wake daemon into launchd...")
-                subprocess.run(['sudo', 'launchctl', 'load', str(system_wake_plist)], check=True)
-            
-            # 2. Install Claude Agent (user-level, no sudo needed)
+                print("  - Copying wake daemon plist to LaunchDaemons and loading it into launchd...")
             print("\n• Installing Claude agent...")
-            agent_plist_path = scripts_dir / f'{self.daemon_label}.Agent.plist'
-            user_agents_dir = Path.home() / 'Library' / 'LaunchAgents'
-            user_agents_dir.mkdir(parents=True, exist_ok=True)
-            user_agent_plist = user_agents_dir / f'{self.daemon_label}.Agent.plist'
+            print("  - Copying agent plist to LaunchAgents and loading it into launchd...")
             
-            print("  - Copying agent plist to LaunchAgents...")
-            shutil.copy(str(agent_plist_path), str(user_agent_plist))
+            # The system daemon and the user agent are independent, so install them concurrently
+            with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+                jobs = [executor.submit(self._install_agent, agent_plist_path)]
+                if enable_wake:
+                    jobs.append(executor.submit(self._install_wake_daemon, wake_daemon_plist_path))
             
-            print("  - Loading agent into launchd...")
-            subprocess.run(['launchctl', 'load', str(user_agent_plist)], check=True)
+            for job in jobs:
+                job.result()
             
-            if self.config.get('enable_wake', False):
+            if enable_wake:
                 print("Setting up wake schedules...")
-                # Clear any existing wake schedules
-                subprocess.run(['sudo', 'pmset', 'schedule', 'cancelall'], 
-                             capture_output=True, text=True)
+                # (day, date, HH:MM) for every wake, applied below in a single sudo call
+                wake_times = []
                 
                 # Get current time
-                from datetime import datetime
                 now = datetime.now()
                 current_minutes = now.hour * 60 + now.minute
                 
-                # Set wake times for TODAY (remaining sessions)
-                today = subprocess.run(['date', '+%m/%d/%y'], 
-                                     capture_output=True, text=True).stdout.strip()
-                wake_count = 0
-                
-                for sched in self.config['schedule']:
-                    time_parts = sched['time'].split(':')
-                    hour = int(time_parts[0])
-                    minute = int(time_parts[1])
-                    sched_minutes = hour * 60 + minute
-                    
-                    if sched_minutes > current_minutes:
-                        wake_offset = sched.get('wake_minutes_before', 5)
-                        wake_minute = minute - wake_offset
-                        wake_hour = hour
-                        if wake_minute < 0:
-                            wake_minute += 60
-                            wake_hour -= 1
-                        wake_cmd = f"{today} {wake_hour:02d}:{wake_minute:02d}:00"
-                        subprocess.run(['sudo', 'pmset', 'schedule', 'wake', wake_cmd], check=True)
-                        wake_count += 1
-                        print(f"  • Set wake for today at {wake_hour:02d}:{wake_minute:02d}")
+                # Set wake times for TODAY (remaining sessions, i.e. everything after now)
+                today = now.strftime('%m/%d/%y')
+                first_remaining = bisect.bisect_right(self._sorted_minutes, current_minutes)
+                wake_times.extend(('today', today, slot.wake_time)
+                                  for slot in self._sorted_slots[first_remaining:])
                 
                 # Set wake times for TOMORROW (all sessions)
-                tomorrow = subprocess.run(['date', '-v+1d', '+%m/%d/%y'], 
-                                        capture_output=True, text=True).stdout.strip()
+                tomorrow = (now + timedelta(days=1)).strftime('%m/%d/%y')
+                wake_times.extend(('tomorrow', tomorrow, slot.wake_time) for slot in self._sorted_slots)
                 
-                for sched in self.config['schedule']:
-                    time_parts = sched['time'].split(':')
-                    hour = int(time_parts[0])
-                    minute = int(time_parts[1])
-                    wake_offset = sched.get('wake_minutes_before', 5)
-                    wake_minute = minute - wake_offset
-                    wake_hour = hour
-                    if wake_minute < 0:
-                        wake_minute += 60
-                        wake_hour -= 1
-                    wake_cmd = f"{tomorrow} {wake_hour:02d}:{wake_minute:02d}:00"
-                    subprocess.run(['sudo', 'pmset', 'schedule', 'wake', wake_cmd], check=True)
-                    print(f"  • Set wake for tomorrow at {wake_hour:02d}:{wake_minute:02d}")
+                # Clear any existing wake schedules, then add all wakes - one fork, one sudo
+                wake_cmds = ' && '.join(f"pmset schedule wake {shlex.quote(f'{date} {hhmm}:00')}"
+                                        for _, date, hhmm in wake_times)
+                pmset_script = f"pmset schedule cancelall >/dev/null 2>&1; {wake_cmds}"
+                subprocess.run(['sudo', 'sh', '-c', pmset_script], check=True)
+                for day, _, hhmm in wake_times:
+                    print(f"  • Set wake for {day} at {hhmm}")
             
             print("\nmacOS schedulers registered successfully!")
-            if self.config.get('enable_wake', False):
+            if enable_wake:
                 print("  ✓ Wake daemon installed (handles system wake scheduling)")
             print("  ✓ Claude agent installed (executes Claude with user permissions)")
         else:
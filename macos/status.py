@@ -1,96 +1,101 @@
 #!/usr/bin/env python3
 
-import sys
-import subprocess
 import os
-import stat
-from pathlib import Path
-sys.path.append(str(Path(__file__).parent.parent))
-from common.base import BaseSchedulerStatus
+import re
+from common.base import BaseSchedulerStatus, tail_lines
+
+
+# Fields from `launchctl print <domain>/<label>`
+_PID_RE = re.compile(r'^\s*pid = (\d+)$', re.MULTILINE)
+_LAST_EXIT_RE = re.compile(r'^\s*last exit code = (.+)$', re.MULTILINE)
+
+# Environment for test runs: the usual install locations of claude ahead of the user's PATH
+_TEST_ENV = {**os.environ, 'PATH': '/usr/local/bin:/usr/bin:/bin:/opt/homebrew/bin:' + os.environ.get('PATH', '')}
 
 
 class MacOSSchedulerStatus(BaseSchedulerStatus):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
+        self.script_path = self.home_dir / 'Library' / 'Application Support' / 'ClaudeScheduler' / 'claude_agent.sh'
+        self.log_dir = self.home_dir / 'Library' / 'Logs' / 'ClaudeScheduler'
         if hasattr(self, 'config') and 'platform_settings' in self.config:
             self.daemon_label = self.config['platform_settings']['macos'].get('daemon_label', 'ClaudeScheduler')
     
     def check_status(self):
-        print("\n=== macOS Scheduler Status ===")
+        import concurrent.futures
+        import subprocess
         
+        out = ["\n=== macOS Scheduler Status ==="]
         try:
+            wake_label = f"{self.daemon_label}.Wake"
+            agent_label = f"{self.daemon_label}.Agent"
+            enable_wake = self.config.get('enable_wake', False)
+            
+            # The probes are independent, so run them concurrently and print once all are back
+            with concurrent.futures.ThreadPoolExecutor(max_workers=3) as executor:
+                if enable_wake:
+                    wake_future = executor.submit(self._query_job, 'system', wake_label)
+                agent_future = executor.submit(self._query_job, f'gui/{os.getuid()}', agent_label)
+                sched_future = executor.submit(subprocess.run, ['pmset', '-g', 'sched'], 
+                                               capture_output=True, text=True)
+            
             # Check Wake Daemon (system-level)
-            if self.config.get('enable_wake', False):
-                print("\nWake Daemon (System):") 
-                result = subprocess.run(['sudo', 'launchctl', 'list'], 
-                                      capture_output=True, text=True)
-                
-                wake_daemon_label = f"{self.daemon_label}.Wake"
-                if wake_daemon_label in result.stdout:
-                    print(f"  ✓ LaunchDaemon '{wake_daemon_label}' is loaded")
-                    
-                    lines = result.stdout.split('\n')
-                    for line in lines:
-                        if wake_daemon_label in line:
-                            parts = line.split()
-                            if len(parts) >= 2:
-                                pid = parts[0]
-                                status = parts[1]
-                                if pid != '-':
-                                    print(f"    PID: {pid}")
-                                print(f"    Last exit status: {status}")
-                else:
-                    print(f"  ✗ LaunchDaemon '{wake_daemon_label}' is not loaded")
+            if enable_wake:
+                out.append("\nWake Daemon (System):")
+                out += self._job_status_lines(wake_future.result(), wake_label, 'LaunchDaemon')
             
             # Check Claude Agent (user-level)
-            print("\nClaude Agent (User):")
-            agent_result = subprocess.run(['launchctl', 'list'],  # No sudo needed
-                                        capture_output=True, text=True)
+            out.append("\nClaude Agent (User):")
+            out += self._job_status_lines(agent_future.result(), agent_label, 'LaunchAgent')
             
-            agent_label = f"{self.daemon_label}.Agent"
-            if agent_label in agent_result.stdout:
-                print(f"  ✓ LaunchAgent '{agent_label}' is loaded")
-                
-                lines = agent_result.stdout.split('\n')
-                for line in lines:
-                    if agent_label in line:
-                        parts = line.split()
-                        if len(parts) >= 2:
-                            pid = parts[0]
-                            status = parts[1]
-                            if pid != '-':
-                                print(f"    PID: {pid}")
-                            print(f"    Last exit status: {status}")
-            else:
-                print(f"  ✗ LaunchAgent '{agent_label}' is not loaded")
+            out.append("\nWake Schedule:")
+            wake_result = sched_future.result()
             
-            print("\nWake Schedule:")
-            wake_result = subprocess.run(['pmset', '-g', 'sched'], 
-                                        capture_output=True, text=True)
-            
-            if wake_result.stdout.strip():
-                for line in wake_result.stdout.strip().split('\n'):
-                    if line.strip():
-                        print(f"  {line.strip()}")
-            else:
-                print("  No wake schedules set")
+            sched_lines = [f"  {line.strip()}" for line in wake_result.stdout.splitlines() if line.strip()]
+            out += sched_lines or ["  No wake schedules set"]
             
         except subprocess.CalledProcessError as e:
-            print(f"Error checking status: {e}")
+            out.append(f"Error checking status: {e}")
         except Exception as e:
-            print(f"Unexpected error: {e}")
+            out.append(f"Unexpected error: {e}")
+        
+        return out
+    
+    def _query_job(self, domain, label):
+        """Query a single launchd job instead of listing every loaded one (no sudo needed)"""
+        import subprocess
+        
+        return subprocess.run(['launchctl', 'print', f'{domain}/{label}'], 
+                              capture_output=True, text=True)
+    
+    def _job_status_lines(self, result, label, kind):
+        if result.returncode != 0:
+            return [f"  ✗ {kind} '{label}' is not loaded"]
+        
+        lines = [f"  ✓ {kind} '{label}' is loaded"]
+        pid = _PID_RE.search(result.stdout)
+        if pid:
+            lines.append(f"    PID: {pid.group(1)}")
+        last_exit = _LAST_EXIT_RE.search(result.stdout)
+        if last_exit:
+            lines.append(f"    Last exit status: {last_exit.group(1)}")
+        return lines
     
     def test_script(self):
         """Test run the scheduler script to verify it works"""
+        import subprocess
+        
         print("Claude Scheduler Test Mode")
         print("=" * 50)
         print("\n=== Testing macOS Scheduler Script ===\n")
         
         # Check for agent script in Application Support (user-level script)
-        app_support_dir = Path.home() / 'Library' / 'Application Support' / 'ClaudeScheduler'
-        script_path = app_support_dir / 'claude_agent.sh'
+        script_path = self.script_path
         
-        if not script_path.exists():
+        # One stat answers both "does it exist" and "is it executable"
+        try:
+            mode = script_path.stat().st_mode
+        except FileNotFoundError:
             print(f"✗ Script not found at: {script_path}")
             print("\nSolution: Run 'python3 setup.py' to generate the script")
             return
@@ -98,19 +103,14 @@ class MacOSSchedulerStatus(BaseSchedulerStatus):
         print(f"✓ Script found: {script_path}")
         
         # Check script permissions
-        try:
-            st = os.stat(script_path)
-            mode = st.st_mode
-            is_executable = bool(mode & stat.S_IXUSR)
-            
-            print(f"\nScript permissions: {oct(stat.S_IMODE(mode))}")
-            if is_executable:
-                print("✓ Script is executable")
-            else:
-                print("✗ Script is not executable")
-                print(f"\nFix with: chmod +x {script_path}")
-        except Exception as e:
-            print(f"Error checking permissions: {e}")
+        is_executable = bool(mode & 0o100)  # owner execute bit
+        
+        print(f"\nScript permissions: {mode & 0o777:03o}")
+        if is_executable:
+            print("✓ Script is executable")
+        else:
+            print("✗ Script is not executable")
+            print(f"\nFix with: chmod +x {script_path}")
         
         # Check if script is in Application Support (good) or Documents (bad)
         if '/Application Support/' in str(script_path):
@@ -132,7 +132,7 @@ class MacOSSchedulerStatus(BaseSchedulerStatus):
                 capture_output=True,
                 text=True,
                 timeout=5,
-                env={**os.environ, 'PATH': '/usr/local/bin:/usr/bin:/bin:/opt/homebrew/bin:' + os.environ.get('PATH', '')}
+                env=_TEST_ENV
             )
             
             if result.returncode == 0:
@@ -181,26 +181,32 @@ class MacOSSchedulerStatus(BaseSchedulerStatus):
         print("Checking log files...")
         print("=" * 30 + "\n")
         
-        log_locations = [
-            Path.home() / 'Library' / 'Logs' / 'ClaudeScheduler' / 'claude_scheduler.log',  # Main agent log
-            Path.home() / 'Library' / 'Logs' / 'ClaudeScheduler' / 'wake_scheduler.log',    # Wake daemon log
-            Path.home() / 'Library' / 'Logs' / 'ClaudeScheduler' / 'agent.out',
-            Path.home() / 'Library' / 'Logs' / 'ClaudeScheduler' / 'agent.err',
-            Path.home() / 'Library' / 'Logs' / 'ClaudeScheduler' / 'wake_daemon.out',
-            Path.home() / 'Library' / 'Logs' / 'ClaudeScheduler' / 'wake_daemon.err'
+        log_names = [
+            'claude_scheduler.log',  # Main agent log
+            'wake_scheduler.log',    # Wake daemon log
+            'agent.out',
+            'agent.err',
+            'wake_daemon.out',
+            'wake_daemon.err'
         ]
         
+        # One directory listing instead of an exists() stat per candidate
+        try:
+            with os.scandir(self.log_dir) as entries:
+                present = {entry.name for entry in entries}
+        except FileNotFoundError:
+            present = set()
+        
         found_logs = False
-        for log_path in log_locations:
-            if log_path.exists():
+        for name in log_names:
+            if name in present:
+                log_path = self.log_dir / name
                 found_logs = True
                 print(f"✓ Log file found: {log_path}")
                 try:
-                    # Show last few lines
-                    with open(log_path, 'r', encoding='utf-8') as f:
-                        lines = f.readlines()
-                        if lines:
-                            print(f"  Last entry: {lines[-1].strip()}")
+                    lines = tail_lines(log_path, 1)
+                    if lines:
+                        print(f"  Last entry: {lines[-1].strip()}")
                 except PermissionError:
                     print(f"  (Permission denied reading log)")
         
@@ -1,12 +1,26 @@
 #!/usr/bin/env python3
 
-import sys
-import subprocess
+import os
+import shlex
 from pathlib import Path
-sys.path.append(str(Path(__file__).parent.parent))
 from common.base import BaseSchedulerUninstall
 
 
+# Already root (e.g. run via sudo): call privileged commands directly, no sudo fork or PAM check
+_SUDO = [] if os.geteuid() == 0 else ['sudo']
+
+
+def _remove_tree(path):
+    """rmtree without a separate exists() stat; returns False if there was nothing to remove"""
+    import shutil
+    
+    try:
+        shutil.rmtree(path)
+    except FileNotFoundError:
+        return False
+    return True
+
+
 class MacOSSchedulerUninstall(BaseSchedulerUninstall):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
@@ -14,35 +28,55 @@ class MacOSSchedulerUninstall(BaseSchedulerUninstall):
             self.daemon_label = self.config['platform_settings']['macos'].get('daemon_label', 'ClaudeScheduler')
     
     def uninstall(self):
+        import subprocess
+        
         print("\n=== Uninstalling macOS scheduler ===")
         
         errors_occurred = False
         
         try:
-            # 1. Unload and remove Wake Daemon (if exists)
+            # 1. System-level cleanup: wake daemon, old-style daemon and pmset wakes.
+            # All of it runs in one privileged shell - a single sudo prompt and fork.
+            system_plists = []
+            privileged_cmds = []
+            
             wake_daemon_plist = f'/Library/LaunchDaemons/{self.daemon_label}.Wake.plist'
             if Path(wake_daemon_plist).exists():
-                print("\nUnloading wake daemon...")
-                result = subprocess.run(['sudo', 'launchctl', 'unload', wake_daemon_plist], 
-                                      capture_output=True, text=True)
-                if result.returncode != 0 and 'No such process' not in result.stderr:
-                    print(f"  Warning: {result.stderr.strip()}")
-                
-                print("Removing wake daemon plist...")
-                subprocess.run(['sudo', 'rm', wake_daemon_plist], check=True)
-                print("  ✓ Wake daemon removed")
+                print("\nUnloading and removing wake daemon...")
+                system_plists.append(wake_daemon_plist)
+                # stderr is kept so a failed unload is reported below
+                privileged_cmds.append(f"launchctl unload {shlex.quote(wake_daemon_plist)}")
             
             # Check for old-style daemon (from previous versions)
             old_daemon_plist = f'/Library/LaunchDaemons/{self.daemon_label}.plist'
             if Path(old_daemon_plist).exists():
                 print("\nRemoving old-style daemon...")
-                subprocess.run(['sudo', 'launchctl', 'unload', old_daemon_plist], 
-                             capture_output=True, text=True)
-                subprocess.run(['sudo', 'rm', old_daemon_plist], check=True)
+                system_plists.append(old_daemon_plist)
+                privileged_cmds.append(f"launchctl unload {shlex.quote(old_daemon_plist)} 2>/dev/null")
+            
+            print("Cancelling wake schedules...")
+            # Cancelling is best effort, as before; without plists to remove the script then exits 0
+            privileged_cmds += ["pmset repeat cancel >/dev/null 2>&1 || true", 
+                                "pmset schedule cancelall >/dev/null 2>&1 || true"]
+            if system_plists:
+                # Last, so its exit status is the script's - a failed removal is an error
+                privileged_cmds.append('rm -f -- ' + ' '.join(shlex.quote(plist) for plist in system_plists))
+            result = subprocess.run(_SUDO + ['sh', '-c', '; '.join(privileged_cmds)], 
+                                  capture_output=True, text=True)
+            for line in result.stderr.splitlines():
+                if line.strip() and 'No such process' not in line:
+                    print(f"  Warning: {line.strip()}")
+                    errors_occurred = True
+            if result.returncode != 0:
+                raise subprocess.CalledProcessError(result.returncode, result.args, result.stdout, result.stderr)
+            
+            if wake_daemon_plist in system_plists:
+                print("  ✓ Wake daemon removed")
+            if old_daemon_plist in system_plists:
                 print("  ✓ Old daemon removed")
             
             # 2. Unload and remove Claude Agent
-            agent_plist = Path.home() / 'Library' / 'LaunchAgents' / f'{self.daemon_label}.Agent.plist'
+            agent_plist = self.home_dir / 'Library' / 'LaunchAgents' / f'{self.daemon_label}.Agent.plist'
             if agent_plist.exists():
                 print("\nUnloading Claude agent...")
                 result = subprocess.run(['launchctl', 'unload', str(agent_plist)], 
@@ -62,32 +96,23 @@ class MacOSSchedulerUninstall(BaseSchedulerUninstall):
                 f'{self.daemon_label}',  # Base name without suffix
             ]
             
-            for label in known_test_labels:
-                result = subprocess.run(['launchctl', 'remove', label], 
-                                      capture_output=True, text=True)
-                if result.returncode == 0:
-                    print(f"  ✓ Removed orphaned agent: {label}")
-            
-            print("Cancelling wake schedules...")
-            subprocess.run(['sudo', 'pmset', 'repeat', 'cancel'], 
-                          capture_output=True, text=True)
-            subprocess.run(['sudo', 'pmset', 'schedule', 'cancelall'], 
-                          capture_output=True, text=True)
+            # One shell for all labels; it prints the ones launchctl actually removed, one per line
+            remove_script = '; '.join(f"launchctl remove {shlex.quote(label)} 2>/dev/null && printf '%s\\n' {shlex.quote(label)}"
+                                      for label in known_test_labels)
+            result = subprocess.run(['sh', '-c', remove_script], capture_output=True, text=True)
+            for label in result.stdout.splitlines():
+                print(f"  ✓ Removed orphaned agent: {label}")
             
             # Clean up Application Support directory
-            app_support_dir = Path.home() / 'Library' / 'Application Support' / 'ClaudeScheduler'
-            if app_support_dir.exists():
-                print(f"Removing application directory: {app_support_dir}")
-                import shutil
-                shutil.rmtree(app_support_dir)
+            app_support_dir = self.home_dir / 'Library' / 'Application Support' / 'ClaudeScheduler'
+            if _remove_tree(app_support_dir):
+                print(f"Removed application directory: {app_support_dir}")
             
             if self.remove_logs:
                 # Remove new log directory
-                log_dir = Path.home() / 'Library' / 'Logs' / 'ClaudeScheduler'
-                if log_dir.exists():
-                    print(f"Removing log directory: {log_dir}")
-                    import shutil
-                    shutil.rmtree(log_dir)
+                log_dir = self.home_dir / 'Library' / 'Logs' / 'ClaudeScheduler'
+                if _remove_tree(log_dir):
+                    print(f"Removed log directory: {log_dir}")
                 
                 # Also try to remove old log files
                 old_log_files = [
@@ -96,14 +121,28 @@ class MacOSSchedulerUninstall(BaseSchedulerUninstall):
                     Path('/var/log/claude-scheduler.out'),
                     Path('/var/log/claude-scheduler.err')
                 ]
+                # Try without sudo first; only root-owned files in /var/log need it,
+                # and those are removed together in one sudo call
+                privileged_logs = []
                 for log_file in old_log_files:
-                    if log_file.exists():
-                        print(f"Removing old log file: {log_file}")
-                        try:
-                            subprocess.run(['sudo', 'rm', str(log_file)], 
-                                         capture_output=True, text=True)
-                        except:
-                            pass
+                    try:
+                        log_file.unlink()
+                    except FileNotFoundError:
+                        continue
+                    except PermissionError:
+                        privileged_logs.append(log_file)
+                        continue
+                    print(f"Removed old log file: {log_file}")
+                
+                if privileged_logs:
+                    result = subprocess.run(_SUDO + ['rm', '-f', '--', *map(str, privileged_logs)],
+                                          stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
+                    if result.returncode == 0:
+                        for log_file in privileged_logs:
+                            print(f"Removed old log file: {log_file}")
+                    else:
+                        print(f"  Warning: could not remove old log files: {result.stderr.strip()}")
+                        errors_occurred = True
             
             if not errors_occurred:
                 print("\nmacOS scheduler uninstalled successfully!")
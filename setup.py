@@ -1,29 +1,29 @@
 #!/usr/bin/env python3
 
 import sys
-import platform
 import argparse
 
 
+# Platform -> (module, class); only the running platform's module is ever imported
+_SETUP_CLASSES = {
+    'macos': ('macos.setup', 'MacOSSchedulerSetup'),
+    'linux': ('linux.setup', 'LinuxSchedulerSetup'),
+    'windows': ('windows.setup', 'WindowsSchedulerSetup'),
+}
+
+
 def get_platform_setup_class():
     """Factory function to get the appropriate platform-specific setup class"""
-    current_platform = platform.system().lower()
+    from common.base import current_platform
     
-    if current_platform == 'darwin':
-        current_platform = 'macos'
-    
-    if current_platform == 'macos':
-        from macos.setup import MacOSSchedulerSetup
-        return MacOSSchedulerSetup
-    elif current_platform == 'linux':
-        from linux.setup import LinuxSchedulerSetup
-        return LinuxSchedulerSetup
-    elif current_platform == 'windows':
-        from windows.setup import WindowsSchedulerSetup
-        return WindowsSchedulerSetup
-    else:
-        print(f"Error: Unsupported platform {current_platform}")
+    platform_name = current_platform()
+    if platform_name not in _SETUP_CLASSES:
+        print(f"Error: Unsupported platform {platform_name}")
         sys.exit(1)
+    
+    import importlib
+    module_name, class_name = _SETUP_CLASSES[platform_name]
+    return getattr(importlib.import_module(module_name), class_name)
 
 def main():
     parser = argparse.ArgumentParser(description='Claude Scheduler Setup')
@@ -1,29 +1,29 @@
 #!/usr/bin/env python3
 
 import sys
-import platform
 import argparse
 
 
+# Platform -> (module, class); only the running platform's module is ever imported
+_STATUS_CLASSES = {
+    'macos': ('macos.status', 'MacOSSchedulerStatus'),
+    'linux': ('linux.status', 'LinuxSchedulerStatus'),
+    'windows': ('windows.status', 'WindowsSchedulerStatus'),
+}
+
+
 def get_platform_status_class():
     """Factory function to get the appropriate platform-specific status class"""
-    current_platform = platform.system().lower()
+    from common.base import current_platform
     
-    if current_platform == 'darwin':
-        current_platform = 'macos'
-    
-    if current_platform == 'macos':
-        from macos.status import MacOSSchedulerStatus
-        return MacOSSchedulerStatus
-    elif current_platform == 'linux':
-        from linux.status import LinuxSchedulerStatus
-        return LinuxSchedulerStatus
-    elif current_platform == 'windows':
-        from windows.status import WindowsSchedulerStatus
-        return WindowsSchedulerStatus
-    else:
-        print(f"Error: Unsupported platform {current_platform}")
+    platform_name = current_platform()
+    if platform_name not in _STATUS_CLASSES:
+        print(f"Error: Unsupported platform {platform_name}")
         sys.exit(1)
+    
+    import importlib
+    module_name, class_name = _STATUS_CLASSES[platform_name]
+    return getattr(importlib.import_module(module_name), class_name)
 
 
 def main():
@@ -34,6 +34,8 @@ def main():
                        help='Test run the scheduler script to verify it works')
     parser.add_argument('--config', default='config.json', 
                        help='Path to configuration file')
+    parser.add_argument('--refresh', action='store_true',
+                       help='Ignore cached detection results (claude CLI, systemd, WSL)')
     
     args = parser.parse_args()
     
@@ -43,7 +45,8 @@ def main():
     # Create an instance with the provided arguments
     status_checker = StatusClass(
         config_path=args.config,
-        show_logs=args.logs
+        show_logs=args.logs,
+        refresh=args.refresh
     )
     
     try:
@@ -1,29 +1,29 @@
 #!/usr/bin/env python3
 
 import sys
-import platform
 import argparse
 
 
+# Platform -> (module, class); only the running platform's module is ever imported
+_UNINSTALL_CLASSES = {
+    'macos': ('macos.uninstall', 'MacOSSchedulerUninstall'),
+    'linux': ('linux.uninstall', 'LinuxSchedulerUninstall'),
+    'windows': ('windows.uninstall', 'WindowsSchedulerUninstall'),
+}
+
+
 def get_platform_uninstall_class():
     """Factory function to get the appropriate platform-specific uninstall class"""
-    current_platform = platform.system().lower()
+    from common.base import current_platform
     
-    if current_platform == 'darwin':
-        current_platform = 'macos'
-    
-    if current_platform == 'macos':
-        from macos.uninstall import MacOSSchedulerUninstall
-        return MacOSSchedulerUninstall
-    elif current_platform == 'linux':
-        from linux.uninstall import LinuxSchedulerUninstall
-        return LinuxSchedulerUninstall
-    elif current_platform == 'windows':
-        from windows.uninstall import WindowsSchedulerUninstall
-        return WindowsSchedulerUninstall
-    else:
-        print(f"Error: Unsupported platform {current_platform}")
+    platform_name = current_platform()
+    if platform_name not in _UNINSTALL_CLASSES:
+        print(f"Error: Unsupported platform {platform_name}")
         sys.exit(1)
+    
+    import importlib
+    module_name, class_name = _UNINSTALL_CLASSES[platform_name]
+    return getattr(importlib.import_module(module_name), class_name)
 
 
 def main():
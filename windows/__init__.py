@@ -1,7 +1,13 @@
 #!/usr/bin/env python3
 
-from .setup import WindowsSchedulerSetup
-from .status import WindowsSchedulerStatus
-from .uninstall import WindowsSchedulerUninstall
+from common.base import lazy_exports
 
-__all__ = ['WindowsSchedulerSetup', 'WindowsSchedulerStatus', 'WindowsSchedulerUninstall']
\ No newline at end of file
+_EXPORTS = {
+    'WindowsSchedulerSetup': '.setup',
+    'WindowsSchedulerStatus': '.status',
+    'WindowsSchedulerUninstall': '.uninstall',
+}
+
+__all__ = list(_EXPORTS)
+
+__getattr__ = lazy_exports(__name__, _EXPORTS)
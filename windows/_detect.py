@@ -0,0 +1,17 @@
+#!/usr/bin/env python3
+
+import functools
+from common.base import NO_WINDOW, cached_probe
+
+
+def _probe_wsl():
+    import shutil
+    
+    return shutil.which('wsl')
+
+
+@functools.lru_cache(maxsize=2)
+def find_wsl(refresh=False):
+    """Path to wsl.exe, or None; looked up once per process and remembered on disk for a minute
+    (refresh=True ignores the saved result)"""
+    return cached_probe('wsl_path', 60, _probe_wsl, refresh=refresh)
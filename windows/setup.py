@@ -1,63 +1,33 @@
 #!/usr/bin/env python3
 
-import sys
-import subprocess
-import shutil
-from pathlib import Path
-sys.path.append(str(Path(__file__).parent.parent))
-from common.base import BaseSchedulerSetup
+import codecs
+import functools
+from string import Template
+from common.base import BaseSchedulerSetup, write_atomic
+from ._detect import find_wsl
 
 
-class WindowsSchedulerSetup(BaseSchedulerSetup):
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-        if hasattr(self, 'config') and 'platform_settings' in self.config:
-            self.task_name = self.config['platform_settings']['windows'].get('task_name', 'ClaudeScheduler')
-            self.command = self.config['platform_settings']['windows'].get('command', self.config.get('command', 'wsl claude'))
-    
-    def check_prerequisites(self):
-        print("Checking prerequisites...")
-        
-        # Windows requires WSL
-        wsl_check = shutil.which('wsl')
-        if not wsl_check:
-            print("Error: WSL (Windows Subsystem for Linux) not found.")
-            print("Please install WSL and ensure claude is installed within WSL.")
-            print("See: https://docs.microsoft.com/en-us/windows/wsl/install")
-            return False
-        print("+ WSL found")
-        print("Note: Claude must be installed and configured inside WSL")
-        
-        print("Prerequisites check passed!")
-        return True
-    
-    def generate_windows_xml(self, task_name, username, script_path, enable_wake):
-        """Generate Windows Task Scheduler XML with dynamic schedule times"""
-        trigger_entries = []
-        
-        for sched in self.config['schedule']:
-            time = sched['time']
-            trigger_entries.append(f"""    <CalendarTrigger>
+_TRIGGER_ENTRY = """    <CalendarTrigger>
       <StartBoundary>2024-01-01T{time}:00</StartBoundary>
       <Enabled>true</Enabled>
       <ScheduleByDay>
         <DaysInterval>1</DaysInterval>
       </ScheduleByDay>
-    </CalendarTrigger>""")
-        
-        xml_content = f"""<?xml version="1.0" encoding="UTF-16"?>
+    </CalendarTrigger>"""
+
+_TASK_TEMPLATE = Template("""<?xml version="1.0" encoding="UTF-16"?>
 <Task version="1.2" xmlns="http://schemas.microsoft.com/windows/2004/02/mit/task">
   <RegistrationInfo>
     <Date>2024-01-01T00:00:00</Date>
-    <Author>{username}</Author>
+    <Author>${username}</Author>
     <Description>Claude Scheduler - Runs claude command at scheduled times</Description>
   </RegistrationInfo>
   <Triggers>
-{chr(10).join(trigger_entries)}
+${triggers}
   </Triggers>
   <Principals>
     <Principal id="Author">
-      <UserId>{username}</UserId>
+      <UserId>${username}</UserId>
       <LogonType>InteractiveToken</LogonType>
       <RunLevel>HighestAvailable</RunLevel>
     </Principal>
@@ -77,26 +47,81 @@ class WindowsSchedulerSetup(BaseSchedulerSetup):
     <Enabled>true</Enabled>
     <Hidden>false</Hidden>
     <RunOnlyIfIdle>false</RunOnlyIfIdle>
-    <WakeToRun>{enable_wake}</WakeToRun>
+    <WakeToRun>${enable_wake}</WakeToRun>
     <ExecutionTimeLimit>PT1H</ExecutionTimeLimit>
     <Priority>7</Priority>
   </Settings>
   <Actions Context="Author">
     <Exec>
       <Command>powershell.exe</Command>
-      <Arguments>-ExecutionPolicy Bypass -File "{script_path}"</Arguments>
+      <Arguments>-ExecutionPolicy Bypass -File "${script_path}"</Arguments>
     </Exec>
   </Actions>
-</Task>"""
+</Task>""")
+
+
+@functools.lru_cache(maxsize=8)
+def _xml_for(schedule_key, username, script_path, enable_wake):
+    """Render the task XML for a tuple of HH:MM schedule times"""
+    from xml.sax.saxutils import escape
+    
+    triggers = '\n'.join(_TRIGGER_ENTRY.format(time=time) for time in schedule_key)
+    
+    # Escape the values that come from the environment; the rest is fixed markup
+    return _TASK_TEMPLATE.substitute(
+        username=escape(username),
+        triggers=triggers,
+        enable_wake=enable_wake,
+        script_path=escape(script_path)
+    )
+
+
+def _ps_quote(value):
+    """Quote a value as a PowerShell single-quoted literal"""
+    return "'" + str(value).replace("'", "''") + "'"
+
+
+class WindowsSchedulerSetup(BaseSchedulerSetup):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        if hasattr(self, 'config') and 'platform_settings' in self.config:
+            self.task_name = self.config['platform_settings']['windows'].get('task_name', 'ClaudeScheduler')
+            self.command = self.config['platform_settings']['windows'].get('command', self.config.get('command', 'wsl claude'))
+    
+    def check_prerequisites(self):
+        print("Checking prerequisites...")
+        
+        # Windows requires WSL
+        wsl_check = find_wsl(refresh=True)
+        if not wsl_check:
+            print("Error: WSL (Windows Subsystem for Linux) not found.")
+            print("Please install WSL and ensure claude is installed within WSL.")
+            print("See: https://docs.microsoft.com/en-us/windows/wsl/install")
+            return False
+        print("+ WSL found")
+        print("Note: Claude must be installed and configured inside WSL")
         
-        return xml_content
+        print("Prerequisites check passed!")
+        return True
+    
+    def generate_windows_xml(self, task_name, username, script_path, enable_wake):
+        """Generate Windows Task Scheduler XML with dynamic schedule times"""
+        schedule_key = tuple(sched['time'] for sched in self.config['schedule'])
+        return _xml_for(schedule_key, username, script_path, enable_wake)
     
     def register(self):
+        import subprocess
+        
         print("\n=== Registering Windows scheduler ===")
         
         scripts_dir = self.create_scripts_directory()
         platform_dir = self.script_dir / 'windows'
         
+        script_path = scripts_dir / 'claude_scheduler.ps1'
+        script_path_str = str(script_path)
+        xml_path = scripts_dir / f'{self.task_name}.xml'
+        enable_wake = str(self.config.get('enable_wake', False)).lower()
+        
         # Don't escape single quotes anymore since we're using a different approach
         # The command will be used as-is in the bash script
         command = self.command
@@ -108,14 +133,14 @@ class WindowsSchedulerSetup(BaseSchedulerSetup):
             'WORKING_DIR_VALUE': self.config.get('working_directory', '~'),
             'TASK_NAME': self.task_name,
             'LOG_DIR': str(self.home_dir / 'logs'),
-            'SCRIPT_PATH': str(scripts_dir / 'claude_scheduler.ps1'),
-            'ENABLE_WAKE': str(self.config.get('enable_wake', False)).lower(),
+            'SCRIPT_PATH': script_path_str,
+            'ENABLE_WAKE': enable_wake,
             'NTFY_TOPIC': self.config.get('notification_topic', '')
         }
         
         self.generate_from_template(
             platform_dir / 'scheduler.ps1.template',
-            scripts_dir / 'claude_scheduler.ps1',
+            script_path,
             substitutions
         )
         
@@ -123,25 +148,32 @@ class WindowsSchedulerSetup(BaseSchedulerSetup):
         xml_content = self.generate_windows_xml(
             self.task_name,
             self.username,
-            str(scripts_dir / 'claude_scheduler.ps1'),
-            str(self.config.get('enable_wake', False)).lower()
+            script_path_str,
+            enable_wake
         )
         
         if not self.dry_run:
-            xml_path = scripts_dir / f'{self.task_name}.xml'
-            with open(xml_path, 'w', encoding='utf-16') as f:
-                f.write(xml_content)
+            # Task Scheduler expects little-endian UTF-16 with a BOM; spell it out rather than
+            # relying on the 'utf-16' codec's native byte order
+            write_atomic(xml_path, codecs.BOM_UTF16_LE + xml_content.encode('utf-16-le'))
         else:
             if self.verbose:
-                print(f"Would generate XML at: {scripts_dir / f'{self.task_name}.xml'}")
+                print(f"Would generate XML at: {xml_path}")
         
         if not self.dry_run:
             print("\nRegistering with Windows Task Scheduler...")
-            xml_path = scripts_dir / f'{self.task_name}.xml'
             
             print(f"- Creating scheduled task '{self.task_name}'...")
-            subprocess.run(['powershell', '-Command', 
-                          f'Register-ScheduledTask -TaskName "{self.task_name}" -Xml (Get-Content "{xml_path}" | Out-String)'],
+            # One PowerShell start-up for every step; unregistering first lets a re-run replace
+            # the task, and the final query confirms what Task Scheduler now holds
+            task_name = _ps_quote(self.task_name)
+            ps_script = (
+                "$ErrorActionPreference = 'Stop'; "
+                f"Unregister-ScheduledTask -TaskName {task_name} -Confirm:$false -ErrorAction SilentlyContinue; "
+                f"Register-ScheduledTask -TaskName {task_name} -Xml (Get-Content -Raw {_ps_quote(xml_path)}) | Out-Null; "
+                f"Get-ScheduledTask -TaskName {task_name} | Get-ScheduledTaskInfo | Format-List TaskName,NextRunTime"
+            )
+            subprocess.run(['powershell', '-NoProfile', '-NonInteractive', '-Command', ps_script],
                           check=True)
             
             print("Windows Task Scheduler task created successfully!")
@@ -1,10 +1,7 @@
 #!/usr/bin/env python3
 
-import sys
-import subprocess
-from pathlib import Path
-sys.path.append(str(Path(__file__).parent.parent))
 from common.base import BaseSchedulerUninstall
+from ._detect import NO_WINDOW
 
 
 class WindowsSchedulerUninstall(BaseSchedulerUninstall):
@@ -14,17 +11,27 @@ class WindowsSchedulerUninstall(BaseSchedulerUninstall):
             self.task_name = self.config['platform_settings']['windows'].get('task_name', 'ClaudeScheduler')
     
     def uninstall(self):
+        import subprocess
+        
         print("\n=== Uninstalling Windows scheduler ===")
         
         try:
             print(f"Removing Windows Task Scheduler task '{self.task_name}'...")
             result = subprocess.run(['schtasks', '/delete', '/tn', self.task_name, '/f'], 
-                                  capture_output=True, text=True)
+                                  capture_output=True, text=True, creationflags=NO_WINDOW)
             
             if result.returncode == 0:
                 print("Windows Task Scheduler task removed successfully!")
             else:
-                print(f"Task may not exist or error occurred: {result.stderr}")
+                # Deleting directly is one process when the task exists (the usual case);
+                # only a failure pays for the query that tells "absent" from a real error
+                query = subprocess.run(['schtasks', '/query', '/tn', self.task_name], 
+                                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, 
+                                       creationflags=NO_WINDOW)
+                if query.returncode != 0:
+                    print(f"Task '{self.task_name}' is not registered - nothing to remove")
+                else:
+                    print(f"Error removing task: {result.stderr.strip()}")
             
             if self.remove_logs:
                 log_file = self.home_dir / 'logs' / 'claude_scheduler.log'